@@ -14,29 +14,35 @@ __copyright__ = "Copyright 2018-2024, SISSA"
 __license__ = "MIT"
 __status__ = "Production/Stable"
 
-# Imports here are considered as stable API, other internal calls may change.
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
-from . import datatypes  # XSD datatypes
-from . import etree      # Safe parser and helper functions for ElementTree
-from . import protocols  # Protocols for type annotations
+# Imports here are considered as stable API, other internal calls may change.
+# Submodules and classes are loaded lazily on first access (PEP 562), so the
+# import of the package doesn't build the parsers' symbol tables.
 
 from .exceptions import ElementPathError, MissingContextError, ElementPathKeyError, \
     ElementPathZeroDivisionError, ElementPathNameError, ElementPathOverflowError, \
     ElementPathRuntimeError, ElementPathSyntaxError, ElementPathTypeError, \
     ElementPathValueError, ElementPathLocaleError, UnsupportedFeatureError
 
-from .xpath_context import XPathContext, XPathSchemaContext
-from .xpath_nodes import XPathNode, DocumentNode, ElementNode, AttributeNode, \
-    NamespaceNode,  CommentNode, ProcessingInstructionNode, TextNode, \
-    LazyElementNode, SchemaElementNode
-from .tree_builders import get_node_tree, build_node_tree, build_lxml_node_tree, \
-    build_schema_node_tree
-from .xpath_tokens import XPathToken, XPathFunction
-from .xpath1 import XPath1Parser
-from .xpath2 import XPath2Parser
-from .xpath_selectors import select, iter_select, Selector
-from .schema_proxy import AbstractSchemaProxy
-from .regex import RegexError, translate_pattern, install_unicode_data, unicode_version
+if TYPE_CHECKING:
+    from . import datatypes  # XSD datatypes
+    from . import etree      # Safe parser and helper functions for ElementTree
+    from . import protocols  # Protocols for type annotations
+
+    from .xpath_context import XPathContext, XPathSchemaContext
+    from .xpath_nodes import XPathNode, DocumentNode, ElementNode, AttributeNode, \
+        NamespaceNode,  CommentNode, ProcessingInstructionNode, TextNode, \
+        LazyElementNode, SchemaElementNode
+    from .tree_builders import get_node_tree, build_node_tree, build_lxml_node_tree, \
+        build_schema_node_tree
+    from .xpath_tokens import XPathToken, XPathFunction
+    from .xpath1 import XPath1Parser
+    from .xpath2 import XPath2Parser
+    from .xpath_selectors import select, iter_select, Selector, clear_xpath_cache
+    from .schema_proxy import AbstractSchemaProxy
+    from .regex import RegexError, translate_pattern, install_unicode_data, unicode_version
 
 __all__ = ['datatypes', 'protocols', 'etree', 'ElementPathError', 'MissingContextError',
            'UnsupportedFeatureError', 'ElementPathKeyError',
@@ -49,5 +55,64 @@ __all__ = ['datatypes', 'protocols', 'etree', 'ElementPathError', 'MissingContex
            'SchemaElementNode', 'get_node_tree', 'build_node_tree',
            'build_lxml_node_tree', 'build_schema_node_tree', 'XPathToken',
            'XPathFunction', 'XPath1Parser', 'XPath2Parser', 'select', 'iter_select',
-           'Selector', 'AbstractSchemaProxy', 'RegexError', 'translate_pattern',
-           'install_unicode_data', 'unicode_version']
+           'Selector', 'clear_xpath_cache', 'AbstractSchemaProxy', 'RegexError',
+           'translate_pattern', 'install_unicode_data', 'unicode_version']
+
+_LAZY = {
+    'datatypes': None,
+    'etree': None,
+    'protocols': None,
+    'XPathContext': 'xpath_context',
+    'XPathSchemaContext': 'xpath_context',
+    'XPathNode': 'xpath_nodes',
+    'DocumentNode': 'xpath_nodes',
+    'ElementNode': 'xpath_nodes',
+    'AttributeNode': 'xpath_nodes',
+    'NamespaceNode': 'xpath_nodes',
+    'CommentNode': 'xpath_nodes',
+    'ProcessingInstructionNode': 'xpath_nodes',
+    'TextNode': 'xpath_nodes',
+    'LazyElementNode': 'xpath_nodes',
+    'SchemaElementNode': 'xpath_nodes',
+    'get_node_tree': 'tree_builders',
+    'build_node_tree': 'tree_builders',
+    'build_lxml_node_tree': 'tree_builders',
+    'build_schema_node_tree': 'tree_builders',
+    'XPathToken': 'xpath_tokens',
+    'XPathFunction': 'xpath_tokens',
+    'XPath1Parser': 'xpath1',
+    'XPath2Parser': 'xpath2',
+    'select': 'xpath_selectors',
+    'iter_select': 'xpath_selectors',
+    'Selector': 'xpath_selectors',
+    'clear_xpath_cache': 'xpath_selectors',
+    'AbstractSchemaProxy': 'schema_proxy',
+    'RegexError': 'regex',
+    'translate_pattern': 'regex',
+    'install_unicode_data': 'regex',
+    'unicode_version': 'regex',
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        # Submodules are attributes of the package once imported, like eager imports did
+        try:
+            return importlib.import_module(f'.{name}', __name__)
+        except ModuleNotFoundError as err:
+            if err.name != f'{__name__}.{name}':
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    if module_name is None:
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | _LAZY.keys())
@@ -0,0 +1,154 @@
+#
+# Copyright (c), 2024, SISSA (International School for Advanced Studies).
+# All rights reserved.
+# This file is distributed under the terms of the MIT License.
+# See the file 'LICENSE' in the root directory of the present
+# distribution, or http://opensource.org/licenses/MIT.
+#
+# @author Davide Brunato <brunato@sissa.it>
+#
+"""
+An optional on-disk cache of parsed XPath expressions, enabled setting the
+environment variable ELEMENTPATH_CACHE_DIR with the path of the cache directory.
+Cached token trees are stored as pickle files, so the cache directory must be
+writable only by trusted users.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from typing import TYPE_CHECKING, Any, Optional, Tuple
+
+from elementpath import __version__
+
+if TYPE_CHECKING:
+    from elementpath.xpath_tokens import ParserClassType
+
+CACHE_DIR_ENV = 'ELEMENTPATH_CACHE_DIR'
+MAX_ENTRIES = 1024  # the most recently used entries that are kept
+MAX_AGE = 30 * 86400  # seconds after an entry is removed if not used
+
+# Types of the parser arguments that can be part of the key of a cached
+# path. Other arguments, like schemas, are bound to parsers and their repr
+# is not stable between runs, so paths parsed with them are not stored.
+PLAIN_TYPES = (str, int, float, type(None))
+
+
+def get_cache_dir() -> Optional[str]:
+    """Returns the directory of the on-disk cache, `None` if the cache is disabled."""
+    return os.environ.get(CACHE_DIR_ENV) or None
+
+
+def get_cache_key(path: str,
+                  parser_class: 'ParserClassType',
+                  namespaces: Optional[Tuple[Tuple[str, str], ...]],
+                  options: Tuple[Tuple[str, Any], ...]) -> str:
+    """
+    Returns a content-addressed key for a parsed XPath expression. The package
+    version is included, so an upgrade doesn't load token trees of old releases.
+    """
+    data = repr((
+        __version__,
+        parser_class.__module__,
+        parser_class.__qualname__,
+        path,
+        namespaces,
+        options,
+    ))
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def dump_parsed_path(path: str,
+                     parser_class: 'ParserClassType',
+                     namespaces: Optional[Tuple[Tuple[str, str], ...]],
+                     options: Tuple[Tuple[str, Any], ...]) -> Optional[bytes]:
+    """
+    Parses *path* and returns the pickled tokens tree, `None` if the tokens
+    tree can't be pickled.
+    """
+    parser = parser_class(dict(namespaces) if namespaces else None, **dict(options))
+    root_token = parser.parse(path)
+
+    try:
+        return pickle.dumps(root_token, pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return None
+
+
+def load_or_parse(cache_dir: str,
+                  path: str,
+                  parser_class: 'ParserClassType',
+                  namespaces: Optional[Tuple[Tuple[str, str], ...]],
+                  options: Tuple[Tuple[str, Any], ...]) -> Optional[bytes]:
+    """
+    Returns the pickled tokens tree of *path*, loading it from the cache
+    directory if available, otherwise parsing the expression and then storing
+    the pickled tree in the cache. Unreadable entries are ignored, falling back
+    to parsing. Paths parsed with options that are not plain values are never
+    stored. Returns `None` if the tokens tree can't be pickled.
+    """
+    if not all(isinstance(v, PLAIN_TYPES) for _, v in options):
+        return dump_parsed_path(path, parser_class, namespaces, options)
+
+    data: Optional[bytes]
+    key = get_cache_key(path, parser_class, namespaces, options)
+    filename = os.path.join(cache_dir, f'{key}.pkl')
+
+    try:
+        with open(filename, 'rb') as fp:
+            data = fp.read()
+        pickle.loads(data)  # checks the entry before using it
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        pass
+    else:
+        try:
+            os.utime(filename)  # marks the entry as recently used
+        except OSError:
+            pass
+        return data
+
+    data = dump_parsed_path(path, parser_class, namespaces, options)
+    if data is None:
+        return None
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_filename = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    except OSError:
+        return data
+
+    try:
+        with os.fdopen(fd, 'wb') as fp:
+            fp.write(data)
+        os.replace(tmp_filename, filename)  # atomic, concurrent writers are safe
+    except OSError:
+        if os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
+    else:
+        prune_cache(cache_dir)
+
+    return data
+
+
+def prune_cache(cache_dir: str) -> None:
+    """
+    Removes the entries of the cache directory not used for more than MAX_AGE
+    seconds and the least recently used entries exceeding MAX_ENTRIES.
+    """
+    try:
+        entries = sorted(
+            ((entry.stat().st_mtime, entry.path) for entry in os.scandir(cache_dir)
+             if entry.name.endswith('.pkl')),
+            reverse=True
+        )
+    except OSError:
+        return
+
+    expired = time.time() - MAX_AGE
+    for k, (mtime, filename) in enumerate(entries):
+        if k >= MAX_ENTRIES or mtime < expired:
+            try:
+                os.remove(filename)
+            except OSError:
+                pass
@@ -199,19 +199,13 @@ def is_xml_codepoint(cp: int) -> bool:
         0x10000 <= cp <= 0x10FFFF
 
 
-def ordinal(n: int) -> str:
-    if n in (11, 12, 13):
-        return '%dth' % n
+_ORDINAL_SUFFIXES = ('th', 'st', 'nd', 'rd', 'th', 'th', 'th', 'th', 'th', 'th')
 
-    least_significant_digit = n % 10
-    if least_significant_digit == 1:
-        return '%dst' % n
-    elif least_significant_digit == 2:
-        return '%dnd' % n
-    elif least_significant_digit == 3:
-        return '%drd' % n
-    else:
+
+def ordinal(n: int) -> str:
+    if n % 100 in (11, 12, 13):
         return '%dth' % n
+    return '%d%s' % (n, _ORDINAL_SUFFIXES[n % 10])
 
 
 def get_double(value: Union[SupportsFloat, str], xsd_version: str = '1.0') -> float:
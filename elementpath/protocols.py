@@ -109,6 +109,7 @@ class LxmlElementProtocol(ElementProtocol, Protocol):
     def getnext(self) -> Optional['LxmlElementProtocol']: ...
     def getparent(self) -> Optional['LxmlElementProtocol']: ...
     def getprevious(self) -> Optional['LxmlElementProtocol']: ...
+    def keys(self) -> Sequence[Any]: ...
     def itersiblings(self, tag: Optional[str] = ..., *tags: str,
                      preceding: bool = False) -> Iterable['LxmlElementProtocol']: ...
 
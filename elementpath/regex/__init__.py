@@ -18,8 +18,9 @@ from .codepoints import RegexError, iter_code_points
 from .unicode_subsets import UnicodeSubset, UnicodeData, install_unicode_data, \
     unicode_version, unicode_subset, lazy_subset, unicode_category, unicode_block
 from .character_classes import CharacterClass
-from .patterns import translate_pattern
+from .patterns import translate_pattern, compile_pattern
 
-__all__ = ['translate_pattern', 'RegexError', 'UnicodeSubset', 'UnicodeData',
-           'install_unicode_data', 'unicode_version', 'unicode_subset', 'lazy_subset',
-           'unicode_category', 'unicode_block', 'CharacterClass', 'iter_code_points']
+__all__ = ['translate_pattern', 'compile_pattern', 'RegexError', 'UnicodeSubset',
+           'UnicodeData', 'install_unicode_data', 'unicode_version', 'unicode_subset',
+           'lazy_subset', 'unicode_category', 'unicode_block', 'CharacterClass',
+           'iter_code_points']
@@ -11,8 +11,11 @@
 Parse and translate XML Schema regular expressions to Python regex syntax.
 """
 import re
+from functools import lru_cache
 from sys import maxunicode
 
+from elementpath._typing import Pattern
+
 from .codepoints import RegexError
 from .unicode_subsets import UnicodeSubset, unicode_subset
 from .character_classes import CharacterClass, I_SHORTCUT_REPLACE, C_SHORTCUT_REPLACE
@@ -277,3 +280,18 @@ def translate_pattern(pattern: str, flags: int = 0, xsd_version: str = '1.0',
     if not anchors:
         regex.append(r')$(?!\n\Z)')
     return ''.join(regex)
+
+
+@lru_cache(maxsize=256)
+def compile_pattern(pattern: str, flags: int = 0, xsd_version: str = '1.0',
+                    back_references: bool = True, lazy_quantifiers: bool = True,
+                    anchors: bool = True) -> Pattern[str]:
+    """
+    Translates a pattern regex expression and compiles it to a Python regex object,
+    caching the results. Arguments have the same meaning of `translate_pattern()`.
+    The cache is cleared by the installation of a different version of UnicodeData.
+    """
+    python_pattern = translate_pattern(
+        pattern, flags, xsd_version, back_references, lazy_quantifiers, anchors
+    )
+    return re.compile(python_pattern, flags=flags)
@@ -585,6 +585,9 @@ def install_unicode_data(version: Optional[str] = None,
 
     __subsets_cache.clear()
 
+    from .patterns import compile_pattern
+    compile_pattern.cache_clear()  # compiled patterns depend on Unicode categories
+
 
 def unicode_version() -> str:
     """Returns the installed UnicodeData version."""
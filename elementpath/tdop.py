@@ -196,6 +196,14 @@ class Token(MutableSequence[TK]):
     def insert(self, i: int, item: TK) -> None:
         self._items.insert(i, item)
 
+    # Override the generic ABC mixins, that iterate by indexing until IndexError,
+    # with the faster iterators of the underlying list of children.
+    def __iter__(self) -> Iterator[TK]:
+        return iter(self._items)
+
+    def __reversed__(self) -> Iterator[TK]:
+        return reversed(self._items)
+
     def __str__(self) -> str:
         if self.symbol in SPECIAL_SYMBOLS:
             return '%r %s' % (self.value, self.symbol[1:-1])
@@ -217,18 +225,21 @@ class Token(MutableSequence[TK]):
     @property
     def tree(self) -> str:
         """Returns a tree representation string."""
-        if self.symbol == '(name)':
+        symbol = self.symbol
+        if symbol == '(name)':
             return '(%s)' % self.value
-        elif self.symbol in SPECIAL_SYMBOLS:
+        elif symbol in SPECIAL_SYMBOLS:
             return '(%r)' % self.value
-        elif self.symbol == '(':
-            if len(self) == 1:
-                return self[0].tree
-            return f"({' '.join(item.tree for item in self)})"
-        elif not self:
-            return '(%s)' % self.symbol
+
+        items = self._items
+        if symbol == '(':
+            if len(items) == 1:
+                return items[0].tree
+            return f"({' '.join([item.tree for item in items])})"
+        elif not items:
+            return '(%s)' % symbol
         else:
-            return f"({self.symbol} {' '.join(item.tree for item in self)})"
+            return f"({symbol} {' '.join([item.tree for item in items])})"
 
     @property
     def source(self) -> str:
@@ -257,10 +268,11 @@ class Token(MutableSequence[TK]):
     def position(self) -> Tuple[int, int]:
         """A tuple with the position of the token in terms of line and column."""
         token_index = self.span[0]
-        line = self.parser.source[:token_index].count('\n') + 1
-        if line == 1:
+        source = self.parser.source
+        line_start = source.rfind('\n', 0, token_index)
+        if line_start < 0:
             return 1, token_index + 1
-        return line, token_index - self.parser.source[:token_index].rindex('\n')
+        return source.count('\n', 0, line_start) + 2, token_index - line_start
 
     def as_name(self) -> TK:
         """Returns a new '(name)' token for resolving ambiguous states."""
@@ -284,12 +296,8 @@ class Token(MutableSequence[TK]):
         of a source line, ignoring the spaces.
         """
         token_index = self.span[0]
-        try:
-            line_start = self.parser.source[:token_index].rindex('\n') + 1
-        except ValueError:
-            return not bool(self.parser.source[:token_index].strip())
-        else:
-            return not bool(self.parser.source[line_start:token_index].strip())
+        line_start = self.parser.source.rfind('\n', 0, token_index) + 1
+        return not bool(self.parser.source[line_start:token_index].strip())
 
     def is_spaced(self, before: bool = True, after: bool = True) -> bool:
         """
@@ -513,6 +521,9 @@ class Parser(Generic[TK_co], metaclass=ParserMeta):
         :return: The current token instance.
         """
         value: Any
+        token_class: Optional[Type[TK_co]]
+        symbol_table = self.symbol_table
+
         if self.next_token.symbol == '(end)':
             raise self.next_token.wrong_syntax()
         elif symbols and self.next_token.symbol not in symbols:
@@ -525,46 +536,47 @@ class Parser(Generic[TK_co], metaclass=ParserMeta):
             if not self.next_match.group().isspace():
                 break
         else:
-            self.next_token = self.symbol_table['(end)'](self)
+            self.next_token = symbol_table['(end)'](self)
             return self.token
 
         literal, symbol, name, unknown = self.next_match.groups()
         if symbol is not None:
-            if symbol in self.symbol_table:
-                self.next_token = self.symbol_table[symbol](self)
+            token_class = symbol_table.get(symbol)
+            if token_class is not None:
+                self.next_token = token_class(self)
             elif self.name_pattern.match(symbol) is not None:
-                self.next_token = self.symbol_table['(name)'](self, symbol)
+                self.next_token = symbol_table['(name)'](self, symbol)
             else:
-                self.next_token = self.symbol_table['(unknown)'](self, symbol)
+                self.next_token = symbol_table['(unknown)'](self, symbol)
                 raise self.next_token.wrong_syntax()
 
         elif literal is not None:
             if literal[0] in '\'"':
                 value = self.unescape(literal)
-                self.next_token = self.symbol_table['(string)'](self, value)
+                self.next_token = symbol_table['(string)'](self, value)
             elif 'e' in literal or 'E' in literal:
                 try:
                     value = float(literal)
                 except ValueError as err:
-                    self.next_token = self.symbol_table['(invalid)'](self, literal)
+                    self.next_token = symbol_table['(invalid)'](self, literal)
                     raise self.next_token.wrong_syntax(message=str(err))
                 else:
-                    self.next_token = self.symbol_table['(float)'](self, value)
+                    self.next_token = symbol_table['(float)'](self, value)
             elif '.' in literal:
                 try:
                     value = Decimal(literal)
                 except DecimalException as err:
-                    self.next_token = self.symbol_table['(invalid)'](self, literal)
+                    self.next_token = symbol_table['(invalid)'](self, literal)
                     raise self.next_token.wrong_syntax(message=str(err))
                 else:
-                    self.next_token = self.symbol_table['(decimal)'](self, value)
+                    self.next_token = symbol_table['(decimal)'](self, value)
             else:
-                self.next_token = self.symbol_table['(integer)'](self, int(literal))
+                self.next_token = symbol_table['(integer)'](self, int(literal))
 
         elif name is not None:
-            self.next_token = self.symbol_table['(name)'](self, name)
+            self.next_token = symbol_table['(name)'](self, name)
         elif unknown is not None:
-            self.next_token = self.symbol_table['(unknown)'](self, unknown)
+            self.next_token = symbol_table['(unknown)'](self, unknown)
         else:
             msg = "unexpected matching %r: incompatible tokenizer"
             raise RuntimeError(msg % self.next_match.group())
@@ -677,7 +689,9 @@ class Parser(Generic[TK_co], metaclass=ParserMeta):
             if ' ' in symbol:
                 raise ValueError("%r: a symbol can't contain whitespaces" % symbol)
 
-            lookup_name = kwargs.get('lookup_name', symbol)
+            # Interned symbols speed up the equality checks on token symbols
+            symbol = sys.intern(symbol)
+            lookup_name = sys.intern(kwargs.get('lookup_name', symbol))
             try:
                 token_class = cls.symbol_table[lookup_name]
             except KeyError:
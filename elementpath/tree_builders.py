@@ -124,6 +124,11 @@ def build_node_tree(root: ElementTreeRootType,
     if fragment and root_elem is not None:
         document = None  # Explicitly requested a fragment: don't create a document node
 
+    if namespaces is None and not hasattr(root_elem, 'nsmap'):
+        # Share an empty map between element nodes, avoiding a failed nsmap
+        # attribute lookup and a new dictionary for each node built.
+        namespaces = {}
+
     if document is not None:
         document_node = DocumentNode(document, uri, position)
         position += 1
@@ -259,7 +264,8 @@ def build_lxml_node_tree(root: LxmlRootType,
             document_node.children.append(child)
             position += 1
 
-        root_node = ElementNode(root_elem, document_node, position, root_elem.nsmap)
+        nsmap = root_elem.nsmap
+        root_node = ElementNode(root_elem, document_node, position, nsmap)
         document_node.children.append(root_node)
     else:
         if hasattr(root, 'parse'):
@@ -275,17 +281,18 @@ def build_lxml_node_tree(root: LxmlRootType,
             raise ElementPathTypeError(msg)
 
         document_node = None
-        root_node = ElementNode(root_elem, None, position, root_elem.nsmap)
+        nsmap = root_elem.nsmap
+        root_node = ElementNode(root_elem, None, position, nsmap)
         root_node.elements = elements = {}
         if uri is not None:
             root_node.uri = uri
 
     # Complete the root element node build
     elements[root_elem] = root_node
-    if 'xml' in root_elem.nsmap:
-        position += len(root_elem.nsmap) + len(root_elem.attrib) + 1
+    if 'xml' in nsmap:
+        position += len(nsmap) + len(root_elem.keys()) + 1
     else:
-        position += len(root_elem.nsmap) + len(root_elem.attrib) + 2
+        position += len(nsmap) + len(root_elem.keys()) + 2
 
     if root_elem.text is not None:
         root_node.children.append(TextNode(root_elem.text, root_node, position))
@@ -299,11 +306,14 @@ def build_lxml_node_tree(root: LxmlRootType,
     while True:
         for elem in children:
             if not callable(elem.tag):
-                child = ElementNode(elem, parent, position, elem.nsmap)
-                if 'xml' in elem.nsmap:
-                    position += len(elem.nsmap) + len(elem.attrib) + 1
+                # lxml builds a new dictionary at each access of nsmap and a
+                # new proxy at each access of attrib (keys() is cheaper)
+                nsmap = elem.nsmap
+                child = ElementNode(elem, parent, position, nsmap)
+                if 'xml' in nsmap:
+                    position += len(nsmap) + len(elem.keys()) + 1
                 else:
-                    position += len(elem.nsmap) + len(elem.attrib) + 2
+                    position += len(nsmap) + len(elem.keys()) + 2
 
                 if elem.text is not None:
                     child.children.append(TextNode(elem.text, child, position))
@@ -21,7 +21,8 @@ from elementpath.exceptions import ElementPathKeyError, ElementPathTypeError
 from elementpath.helpers import collapse_white_spaces, node_position
 from elementpath.datatypes import AbstractDateTime, AnyURI, Duration, DayTimeDuration, \
     YearMonthDuration, NumericProxy, ArithmeticProxy, NumericType, ArithmeticType
-from elementpath.xpath_context import ContextType, ItemType, XPathSchemaContext
+from elementpath.xpath_context import ContextType, ItemType, XPathContext, \
+    XPathSchemaContext
 from elementpath.namespaces import XMLNS_NAMESPACE, XSD_NAMESPACE
 from elementpath.schema_proxy import AbstractSchemaProxy
 from elementpath.xpath_nodes import ParentNodeType, XPathNode, \
@@ -41,6 +42,13 @@ OPERATORS_MAP = {
     '<=': operator.le,
 }
 
+# Symbols of predicates that depend only on the position and the size of the focus
+POSITIONAL_PREDICATE_SYMBOLS = {
+    '(integer)', '(decimal)', '(float)', '(', 'position', 'last', 'and', 'or', 'not',
+    '=', '!=', '<', '>', '<=', '>=', 'eq', 'ne', 'lt', 'gt', 'le', 'ge',
+    '+', '-', '*', 'div', 'idiv', 'mod', 'true', 'false'
+}
+
 register = XPath1Parser.register
 nullary = XPath1Parser.nullary
 infix = XPath1Parser.infix
@@ -671,7 +679,10 @@ def select_union_operator(self: XPathToken, context: ContextType = None) \
     if context is None:
         raise self.missing_context()
 
-    results = {item for k in range(2) for item in self[k].select(copy(context))}
+    # XPath nodes use identity hashing, so duplicates are removed by a set
+    # built at C level, then nodes are sorted by their document position.
+    results = set(self[0].select(copy(context)))
+    results.update(self[1].select(copy(context)))
     if any(not isinstance(x, XPathNode) for x in results):
         raise self.error('XPTY0004', 'only XPath nodes are allowed')
     elif self.concatenated:
@@ -740,6 +751,24 @@ def select_child_path(self: XPathToken, context: ContextType = None) \
         yield from self[0].select(context)
     else:
         items: Set[ItemType] = set()
+
+        # Collect a chain of child name steps (e.g. 'a/b/c') to select
+        # them with a single descent, without evaluating each step.
+        # Steps bound to XSD types are not collected, because their selection
+        # also sets the XSD types of the matching nodes.
+        names: List[str] = []
+        token = self
+        while token.symbol == '/' and len(token) == 2 and token[1].symbol == '(name)' \
+                and not token[1].xsd_types:
+            names.append(cast(str, token[1].value))
+            token = token[0]
+
+        if len(names) > 1 and self.parser.schema is None \
+                and not isinstance(context, XPathSchemaContext):
+            names.reverse()
+            yield from select_child_names(token, names, context, items)
+            return
+
         for _ in context.inner_focus_select(self[0]):
             if not isinstance(context.item, XPathNode):
                 msg = f"Intermediate step contains an atomic value {context.item!r}"
@@ -751,9 +780,8 @@ def select_child_path(self: XPathToken, context: ContextType = None) \
                 elif result in items:
                     pass
                 elif isinstance(result, ElementNode):
-                    if result.elem not in items:
-                        items.add(result)
-                        yield result
+                    items.add(result)
+                    yield result
                 else:
                     items.add(result)
                     yield result
@@ -761,6 +789,39 @@ def select_child_path(self: XPathToken, context: ContextType = None) \
                         self[1].add_xsd_type(result)
 
 
+def select_child_names(self: XPathToken, names: List[str],
+                       context: XPathContext, items: Set[ItemType]) -> Iterator[ItemType]:
+    """
+    Selects a chain of child name steps on the results of the token. The nodes
+    are matched with nested loops, keeping the document order of a step by step
+    evaluation, and the intermediate steps are never bound to the context.
+    """
+    default_namespace = self.parser.default_namespace
+
+    for item in context.inner_focus_select(self):
+        if not isinstance(item, XPathNode):
+            msg = f"Intermediate step contains an atomic value {item!r}"
+            raise self.error('XPTY0019', msg)
+
+        nodes: List[ParentNodeType]
+        if item is context.document and isinstance(context.root, ElementNode):
+            nodes = [context.root] if context.root.match_name(names[0], default_namespace) else []
+        elif isinstance(item, (ElementNode, DocumentNode)):
+            nodes = [child for child in item if isinstance(child, ElementNode)
+                     and child.match_name(names[0], default_namespace)]
+        else:
+            continue
+
+        for name in names[1:]:
+            nodes = [child for node in nodes for child in node if isinstance(child, ElementNode)
+                     and child.match_name(name, default_namespace)]
+
+        for node in nodes:
+            if node not in items:
+                items.add(node)
+                yield node
+
+
 @method('//')
 def select_descendant_path(self: XPathToken, context: ContextType = None) \
         -> Iterator[ItemType]:
@@ -768,21 +829,26 @@ def select_descendant_path(self: XPathToken, context: ContextType = None) \
     if context is None:
         raise self.missing_context()
     elif len(self) == 2:
+        # A child axis step can select something only from element and
+        # document nodes, so other descendants are skipped without a call.
+        child_axis = self[1].child_axis
         items: Set[ItemType] = set()
         for _ in context.inner_focus_select(self[0]):
             if not isinstance(context.item, XPathNode):
                 raise self.error('XPTY0019')
 
-            for _ in context.iter_descendants():
+            for item in context.iter_descendants():
+                # Descendants are nodes: test the kind, cheaper than a multiple isinstance()
+                if child_axis and item.kind != 'element' and item.kind != 'document':
+                    continue
                 for result in self[1].select(context):
                     if not isinstance(result, XPathNode):
                         yield result
                     elif result in items:
                         pass
                     elif isinstance(result, ElementNode):
-                        if result.elem not in items:
-                            items.add(result)
-                            yield result
+                        items.add(result)
+                        yield result
                     else:
                         items.add(result)
                         yield result
@@ -797,16 +863,18 @@ def select_descendant_path(self: XPathToken, context: ContextType = None) \
         else:
             context.item = context.root  # A fragment or a schema node
 
+        child_axis = self[0].child_axis
         items = set()
-        for _ in context.iter_descendants():
+        for item in context.iter_descendants():
+            if child_axis and item.kind != 'element' and item.kind != 'document':
+                continue
             for result in self[0].select(context):
                 if not isinstance(result, XPathNode):
                     items.add(result)
                 elif result in items:
                     pass
                 elif isinstance(result, ElementNode):
-                    if result.elem not in items:
-                        items.add(result)
+                    items.add(result)
                 else:
                     items.add(result)
                     if isinstance(context, XPathSchemaContext):
@@ -828,6 +896,34 @@ def led_predicate(self: XPathToken, left: XPathToken) -> XPathToken:
 def select_predicate(self: XPathToken, context: ContextType = None) -> Iterator[ItemType]:
     if context is None:
         raise self.missing_context()
+    elif self[1].symbol in ('(integer)', '(decimal)', '(float)'):
+        # A positional predicate with a numeric literal: match the position
+        # directly, without evaluating the predicate for each item.
+        for _ in context.inner_focus_select(self[0]):
+            if context.position == self[1].value:
+                yield context.item
+        return
+    elif self[1].symbol == 'last':
+        for _ in context.inner_focus_select(self[0]):
+            if context.position == context.size:
+                yield context.item
+        return
+    elif all(tk.symbol in POSITIONAL_PREDICATE_SYMBOLS and (tk.symbol != '*' or tk)
+             for tk in self[1].iter()):
+        # A predicate that depends only on the focus position and size (e.g.
+        # 'position() mod 2 = 0') doesn't change the context, so it's evaluated
+        # without copying the context for each item.
+        for _ in context.inner_focus_select(self[0]):
+            value = self[1].evaluate(context)
+            if isinstance(value, list) and len(value) == 1:
+                value = value[0]
+
+            if isinstance(value, NumericProxy):
+                if context.position == value:
+                    yield context.item
+            elif self.boolean_value(value):
+                yield context.item
+        return
 
     for _ in context.inner_focus_select(self[0]):
         if (self[1].label in ('axis', 'kind test') or self[1].symbol == '..') \
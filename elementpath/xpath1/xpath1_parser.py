@@ -11,6 +11,7 @@
 XPath 1.0 implementation - part 1 (parser class and symbols)
 """
 import re
+import sys
 from abc import ABCMeta
 from typing import cast, Any, ClassVar, Dict, List, Optional, Set, Tuple, Type, Union
 
@@ -27,7 +28,7 @@ from elementpath.sequence_types import match_sequence_type
 from elementpath.schema_proxy import AbstractSchemaProxy
 from elementpath.xpath_context import ContextType
 from elementpath.xpath_tokens import XPathTokenType, XPathToken, XPathAxis, \
-    XPathFunction, ProxyToken
+    XPathFunction, ProxyToken, static_value_method
 
 
 class XPath1Parser(Parser[XPathTokenType]):
@@ -148,13 +149,31 @@ class XPath1Parser(Parser[XPathTokenType]):
         else:
             return string_literal[1:-1].replace('""', '"')
 
+    @classmethod
+    def method(cls, symbol: Union[str, Type[XPathTokenType]], bp: int = 0) \
+            -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """
+        Register a token for a symbol that represents a custom operator or redefine
+        a method for an existing token. The evaluate() and select() methods of the
+        tokens that can be evaluated statically return the stored static value.
+        """
+        bind = super(XPath1Parser, cls).method(symbol, bp)
+        lookup_name = symbol if isinstance(symbol, str) else symbol.symbol
+
+        def bind_method(func: Callable[..., Any]) -> Callable[..., Any]:
+            if func.__name__.startswith(('evaluate', 'select')):
+                bind(static_value_method(lookup_name, func))
+                return func
+            return bind(func)
+        return bind_method
+
     @classmethod
     def proxy(cls, symbol: str, label: str = 'proxy', bp: int = 90) -> Type[ProxyToken]:
         """Register a proxy token class for a symbol."""
         if symbol in cls.symbol_table and not issubclass(cls.symbol_table[symbol], ProxyToken):
             # Move the token class before register the proxy token
             token_cls = cls.symbol_table.pop(symbol)
-            cls.symbol_table[f'{{{token_cls.namespace}}}{symbol}'] = token_cls
+            cls.symbol_table[sys.intern(f'{{{token_cls.namespace}}}{symbol}')] = token_cls
 
         token_class_name = "_%s%sProxy" % (
             upper_camel_case(symbol), str(label).title().replace(' ', '')
@@ -247,6 +266,9 @@ class XPath1Parser(Parser[XPathTokenType]):
             root_token.evaluate()  # Static context evaluation
         except MissingContextError:
             pass
+
+        if root_token.evaluate_static_subtrees():
+            root_token.bind_static_value()
         return root_token
 
     def expected_next(self, *symbols: str, message: Optional[str] = None) -> None:
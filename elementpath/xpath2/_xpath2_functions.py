@@ -36,7 +36,7 @@ from elementpath.sequence_types import match_sequence_type
 from elementpath.xpath_context import ContextType, ItemType, XPathSchemaContext
 from elementpath.xpath_nodes import XPathNode, DocumentNode, ElementNode, SchemaElementNode
 from elementpath.xpath_tokens import XPathFunction
-from elementpath.regex import RegexError, translate_pattern
+from elementpath.regex import RegexError, compile_pattern
 from elementpath.collations import CollationManager
 
 from ._xpath2_operators import XPath2Parser
@@ -785,8 +785,8 @@ def evaluate_matches_function(self: XPathFunction, context: ContextType = None)
                 raise self.error('FORX0001', "Invalid regular expression flag %r" % c)
 
     try:
-        python_pattern = translate_pattern(pattern, flags, self.parser.xsd_version)
-        return re.search(python_pattern, input_string, flags=flags) is not None
+        re_pattern = compile_pattern(pattern, flags, self.parser.xsd_version)
+        return re_pattern.search(input_string) is not None
     except (re.error, RegexError) as err:
         if isinstance(context, XPathSchemaContext):
             return False
@@ -821,8 +821,7 @@ def evaluate_replace_function(self: XPathFunction, context: ContextType = None)
                 raise self.error('FORX0001', "Invalid regular expression flag %r" % c)
 
     try:
-        python_pattern = translate_pattern(pattern, flags, self.parser.xsd_version)
-        re_pattern = re.compile(python_pattern, flags=flags)
+        re_pattern = compile_pattern(pattern, flags, self.parser.xsd_version)
     except (re.error, RegexError):
         if isinstance(context, XPathSchemaContext):
             return input_string
@@ -875,8 +874,7 @@ def evaluate_tokenize_function(self: XPathFunction, context: ContextType = None)
                 raise self.error('FORX0001', "Invalid regular expression flag %r" % c)
 
     try:
-        python_pattern = translate_pattern(pattern, flags, self.parser.xsd_version)
-        re_pattern = re.compile(python_pattern, flags=flags)
+        re_pattern = compile_pattern(pattern, flags, self.parser.xsd_version)
     except (re.error, RegexError):
         if isinstance(context, XPathSchemaContext):
             return [input_string]
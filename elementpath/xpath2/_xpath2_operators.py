@@ -216,7 +216,7 @@ def evaluate_quantified_expressions(self: XPathToken, context: ContextType = Non
     selectors = [self[k].select for k in range(1, len(self) - 1, 2)]
 
     for results in copy(context).iter_product(selectors, varnames):
-        context.variables.update(x for x in zip(varnames, results))
+        context.bind_variables(zip(varnames, results))
         if self.boolean_value(self[-1].select(copy(context))):
             if some:
                 return True
@@ -264,7 +264,7 @@ def select_for_expression(self: XPathToken, context: ContextType = None) -> Iter
     selectors = [self[k].select for k in range(1, len(self) - 1, 2)]
 
     for results in copy(context).iter_product(selectors, varnames):
-        context.variables.update(x for x in zip(varnames, results))
+        context.bind_variables(zip(varnames, results))
         yield from self[-1].select(copy(context))
 
 
@@ -204,6 +204,10 @@ class XPath2Parser(XPath1Parser):
         state.pop('tokenizer', None)
         return state
 
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        super(XPath1Parser, self).__init__()  # restores the parser's slots
+
     @property
     def xsd_version(self) -> str:
         if self.schema is None:
@@ -517,6 +521,9 @@ class XPath2Parser(XPath1Parser):
         except MissingContextError:
             pass
 
+        if root_token.evaluate_static_subtrees():
+            root_token.bind_static_value()
+
         if self.schema is not None:
             # Tokens tree labeling with XSD types using a dynamic schema context
             context = self.schema.get_context()
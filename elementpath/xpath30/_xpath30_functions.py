@@ -45,7 +45,7 @@ from elementpath.serialization import get_serialization_params, serialize_to_xml
     serialize_to_json
 from elementpath.xpath_context import ContextType, ItemType, FunctionArgType, \
     XPathContext, XPathSchemaContext
-from elementpath.regex import translate_pattern, RegexError
+from elementpath.regex import compile_pattern, RegexError
 
 from ._xpath30_operators import XPath30Parser
 from .xpath30_helpers import UNICODE_DIGIT_PATTERN, DECIMAL_DIGIT_PATTERN, \
@@ -142,8 +142,9 @@ class _InlineFunction(XPathFunction):
         self.check_arguments_number(len(args))
 
         context = copy(context)
-        if self.variables and context is not None:
-            context.variables.update(self.variables)
+        if context is not None:
+            # Take a private dictionary of variables for binding arguments
+            context.bind_variables(self.variables.items() if self.variables else ())
 
         if self.varnames is None:
             self.varnames = []
@@ -954,8 +955,7 @@ def evaluate_analyze_string_function(self: XPathFunction, context: ContextType =
                 raise self.error('FORX0001', "Invalid regular expression flag %r" % c)
 
     try:
-        python_pattern = translate_pattern(pattern, flags, self.parser.xsd_version)
-        compiled_pattern = re.compile(python_pattern, flags=flags)
+        compiled_pattern = compile_pattern(pattern, flags, self.parser.xsd_version)
     except (re.error, RegexError) as err:
         msg = "Invalid regular expression: {}"
         raise self.error('FORX0002', msg.format(str(err))) from None
@@ -199,7 +199,7 @@ def select_let_expression(self: XPathToken, context: ContextType = None) \
     for k in range(0, len(self) - 1, 2):
         varname = cast(str, self[k][0].value)
         value = self[k+1].evaluate(context)
-        context.variables[varname] = value
+        context.bind_variables(((varname, value),))
 
     yield from self[-1].select(context)
 
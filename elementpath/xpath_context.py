@@ -11,9 +11,9 @@ import datetime
 import importlib
 from copy import copy
 from types import ModuleType
-from typing import TYPE_CHECKING, cast, Any, Dict, List, Optional, Set, Union
+from typing import TYPE_CHECKING, cast, Any, Dict, List, Optional, Set, Tuple, Union
 
-from elementpath._typing import Iterator, Sequence, Callable
+from elementpath._typing import Iterable, Iterator, Sequence, Callable
 from elementpath.aliases import NamespacesType, SequenceType, InputType
 from elementpath.protocols import ElementProtocol, DocumentProtocol
 from elementpath.exceptions import ElementPathTypeError
@@ -125,7 +125,7 @@ class XPathContext:
                  default_place: Optional[str] = None) -> None:
 
         if namespaces:
-            self.namespaces = {k: v for k, v in namespaces.items()}
+            self.namespaces = dict(namespaces)
         else:
             self.namespaces = {}
 
@@ -194,12 +194,25 @@ class XPathContext:
             return f'{self.__class__.__name__}(item={self.item!r})'
 
     def __copy__(self) -> 'XPathContext':
+        # The variables are copy-on-write: the copy shares the dictionary with
+        # the original context, so bindings have to replace it with a new one
+        # (e.g. using bind_variables()) instead of updating it in place.
         obj: XPathContext = object.__new__(self.__class__)
         obj.__dict__.update(self.__dict__)
         obj.axis = None
-        obj.variables = {k: v for k, v in self.variables.items()}
         return obj
 
+    def bind_variables(self, bindings: Iterable[Tuple[str, Any]]) -> None:
+        """
+        Binds values to variables of the context, replacing the dictionary of
+        variables, that can be shared with other copies of the context.
+
+        :param bindings: an iterable of couples with variable name and value.
+        """
+        variables = self.variables.copy()
+        variables.update(bindings)
+        self.variables = variables
+
     @property
     def etree(self) -> ModuleType:
         if self._etree is None:
@@ -351,7 +364,7 @@ class XPathContext:
         while True:
             for value in iterators[k]:
                 try:
-                    self.variables[varnames[k]] = value
+                    self.bind_variables(((varnames[k], value),))
                 except IndexError:
                     pass
 
@@ -434,7 +447,10 @@ class XPathContext:
                     yield self.root
             else:
                 for self.item in self.item:
-                    if self.item.match_name(name, default_namespace):
+                    # The node kind is checked first to skip text, comment and
+                    # processing instruction children without calling match_name().
+                    if self.item.kind == 'element' and \
+                            self.item.match_name(name, default_namespace):
                         assert isinstance(self.item, ElementNode)
                         yield self.item
 
@@ -486,7 +502,7 @@ class XPathContext:
 
                     self.item, self.axis = status
 
-    def iter_descendants(self, axis: Optional[str] = None) -> Iterator[Union[None, XPathNode]]:
+    def iter_descendants(self, axis: Optional[str] = None) -> Iterator[XPathNode]:
         """
         Iterator for 'descendant' and 'descendant-or-self' forward axes and '//' shortcut.
 
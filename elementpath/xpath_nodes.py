@@ -453,11 +453,10 @@ class ElementNode(XPathNode):
     elements: Optional[ElementMapType]
     _namespace_nodes: Optional[List['NamespaceNode']]
     _attributes: Optional[List['AttributeNode']]
-
-    uri: Optional[str] = None
+    uri: Optional[str]
 
     __slots__ = 'nsmap', 'elem', 'xsd_type', 'elements', \
-                '_namespace_nodes', '_attributes', 'children', '__dict__'
+                '_namespace_nodes', '_attributes', 'children', 'uri', '__dict__'
 
     def __init__(self,
                  elem: Union[ElementProtocol, SchemaElemType],
@@ -470,6 +469,7 @@ class ElementNode(XPathNode):
         self.parent = parent
         self.position = position
         self.xsd_type = xsd_type
+        self.uri = None
         self.elements = None
         self._namespace_nodes = None
         self._attributes = None
@@ -493,7 +493,7 @@ class ElementNode(XPathNode):
         return len(self.children)
 
     def __iter__(self) -> Iterator[ChildNodeType]:
-        yield from self.children
+        return iter(self.children)
 
     @property
     def value(self) -> Union[ElementProtocol, SchemaElemType]:
@@ -848,7 +848,7 @@ class DocumentNode(XPathNode):
         return len(self.children)
 
     def __iter__(self) -> Iterator[ChildNodeType]:
-        yield from self.children
+        return iter(self.children)
 
     @property
     def value(self) -> DocumentProtocol:
@@ -942,16 +942,24 @@ class SchemaElementNode(ElementNode):
     The resulting structure can be a tree or a set of disjoint trees.
     With more roots only one of them is the schema node.
     """
-    __slots__ = ()
-
-    ref: Optional['SchemaElementNode'] = None
+    ref: Optional['SchemaElementNode']
     elem: SchemaElemType
 
+    __slots__ = 'ref',
+
+    def __init__(self,
+                 elem: SchemaElemType,
+                 parent: Optional[Union['ElementNode', 'DocumentNode']] = None,
+                 position: int = 1,
+                 nsmap: Optional[MutableMapping[Any, str]] = None,
+                 xsd_type: Optional[XsdTypeProtocol] = None) -> None:
+        super().__init__(elem, parent, position, nsmap, xsd_type)
+        self.ref = None
+
     def __iter__(self) -> Iterator[ChildNodeType]:
         if self.ref is None:
-            yield from self.children
-        else:
-            yield from self.ref.children
+            return iter(self.children)
+        return iter(self.ref.children)
 
     @property
     def attributes(self) -> List['AttributeNode']:
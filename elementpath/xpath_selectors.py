@@ -8,9 +8,14 @@
 # @author Davide Brunato <brunato@sissa.it>
 #
 import datetime
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+import pickle
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
+from weakref import WeakValueDictionary
 
 from elementpath._typing import Iterator
+from elementpath._disk_cache import PLAIN_TYPES, get_cache_dir, load_or_parse, \
+    dump_parsed_path
 from elementpath.aliases import NamespacesType, InputType
 from elementpath.tree_builders import RootArgType
 from elementpath.xpath_context import ItemArgType, XPathContext
@@ -18,7 +23,57 @@ from elementpath.xpath2 import XPath2Parser
 from elementpath.datatypes import Timezone
 
 if TYPE_CHECKING:
-    from elementpath.xpath_tokens import ParserClassType
+    from elementpath.xpath_tokens import ParserClassType, XPathToken
+
+
+@lru_cache(maxsize=1024)
+def _parse_path(path: str,
+                parser_class: 'ParserClassType',
+                namespaces: Optional[Tuple[Tuple[str, str], ...]],
+                options: Tuple[Tuple[str, Any], ...]) -> Optional[bytes]:
+    cache_dir = get_cache_dir()
+    if cache_dir is not None:
+        return load_or_parse(cache_dir, path, parser_class, namespaces, options)
+    return dump_parsed_path(path, parser_class, namespaces, options)
+
+
+def _get_root_token(path: str,
+                    namespaces: Optional[NamespacesType] = None,
+                    parser: Optional['ParserClassType'] = None,
+                    **kwargs: Any) -> 'XPathToken':
+    """
+    Returns the root token of the tokens tree parsed from *path*, using a cache
+    of parsed paths. Tokens store evaluation state (e.g. the variables of inline
+    functions), so the cache keeps serialized trees and each call gets a new
+    tree, with its own parser instance. If any parser argument is not a plain
+    value (e.g. a schema or a dictionary of variable types) or the tree can't
+    be serialized, the path is parsed without caching.
+    """
+    parser_class = parser or XPath2Parser
+    if not all(isinstance(v, PLAIN_TYPES) for v in kwargs.values()):
+        return parser_class(namespaces, **kwargs).parse(path)
+
+    try:
+        data = _parse_path(
+            path,
+            parser_class,
+            tuple(namespaces.items()) if namespaces else None,
+            tuple(kwargs.items())
+        )
+    except TypeError:
+        data = None  # unhashable namespaces
+
+    if data is None:
+        return parser_class(namespaces, **kwargs).parse(path)
+
+    root_token: 'XPathToken' = pickle.loads(data)
+    return root_token
+
+
+def clear_xpath_cache() -> None:
+    """Clears the cache of parsed XPath expressions used by selectors."""
+    _parse_path.cache_clear()
+    _selectors.clear()
 
 
 def select(root: Optional[RootArgType],
@@ -64,8 +119,7 @@ def select(root: Optional[RootArgType],
     :return: a list with XPath nodes or a basic type for expressions based \
     on a function or literal.
     """
-    _parser = (parser or XPath2Parser)(namespaces, **kwargs)
-    root_token = _parser.parse(path)
+    root_token = _get_root_token(path, namespaces, parser, **kwargs)
     context = XPathContext(root, namespaces, uri, fragment, item, position, size,
                            axis, variables, current_dt, timezone)
     return root_token.get_results(context)
@@ -114,8 +168,7 @@ def iter_select(root: Optional[RootArgType],
     :param kwargs: other optional parameters for the parser instance.
     :return: a generator of the XPath expression results.
     """
-    _parser = (parser or XPath2Parser)(namespaces, **kwargs)
-    root_token = _parser.parse(path)
+    root_token = _get_root_token(path, namespaces, parser, **kwargs)
     context = XPathContext(root, namespaces, uri, fragment, item, position, size,
                            axis, variables, current_dt, timezone)
     return root_token.select_results(context)
@@ -144,9 +197,36 @@ class Selector(object):
                  **kwargs: Any) -> None:
 
         self._variables = kwargs.pop('variables', None)  # For backward compatibility
-        self.parser = (parser or XPath2Parser)(namespaces, **kwargs)
         self.path = path
-        self.root_token = self.parser.parse(path)
+        self.root_token = _get_root_token(path, namespaces, parser, **kwargs)
+        self.parser = self.root_token.parser
+
+    @classmethod
+    def get(cls, path: str,
+            namespaces: Optional[NamespacesType] = None,
+            parser: Optional['ParserClassType'] = None,
+            **kwargs: Any) -> 'Selector':
+        """
+        Returns a selector for the XPath expression, sharing the instance with other
+        callers until it's referenced. Arguments are the same of the class. If any
+        argument is not hashable a new instance is returned. Selectors created with
+        the class constructor are not shared and have their own parser instance.
+        """
+        key = (
+            cls,
+            path,
+            parser or XPath2Parser,
+            tuple(namespaces.items()) if namespaces else None,
+            tuple(kwargs.items())
+        )
+        try:
+            selector = _selectors.get(key)
+        except TypeError:
+            return cls(path, namespaces, parser, **kwargs)
+
+        if selector is None:
+            selector = _selectors[key] = cls(path, namespaces, parser, **kwargs)
+        return selector
 
     def __repr__(self) -> str:
         return '%s(path=%r, parser=%s)' % (
@@ -189,3 +269,7 @@ class Selector(object):
 
         context = XPathContext(root, **kwargs)
         return self.root_token.select_results(context)
+
+
+# Selectors shared by Selector.get(), released when they are no more referenced
+_selectors: 'WeakValueDictionary[Tuple[Any, ...], Selector]' = WeakValueDictionary()
@@ -16,6 +16,7 @@ import decimal
 import math
 from copy import copy
 from decimal import Decimal
+from functools import update_wrapper
 from itertools import product
 from typing import TYPE_CHECKING, Any, cast, Dict, List, Optional, SupportsFloat, \
     Tuple, Type, Union
@@ -69,6 +70,17 @@ _LEAF_ELEMENTS_TOKENS = {
     'descendant', 'descendant-or-self', 'following', 'preceding'
 }
 
+# Literals, operators and XPath functions whose result depends only on their operands
+_LITERAL_TOKENS = {'(string)', '(integer)', '(decimal)', '(float)'}
+_STATIC_TOKENS = {
+    '(', ',', 'or', 'and', '=', '!=', '<', '>', '<=', '>=', 'eq', 'ne', 'lt',
+    'gt', 'le', 'ge', '+', '-', '*', 'div', 'idiv', 'mod', '||', 'true', 'false',
+    'not', 'boolean', 'string', 'number', 'string-length', 'normalize-space',
+    'concat', 'string-join', 'contains', 'starts-with', 'ends-with', 'substring',
+    'substring-before', 'substring-after', 'translate', 'upper-case', 'lower-case',
+    'abs', 'floor', 'ceiling', 'round', 'count', 'matches', 'replace', 'tokenize'
+}
+
 # Type annotations aliases
 XPathTokenType = Union['XPathToken', 'XPathAxis', 'XPathFunction', 'XPathConstructor']
 
@@ -95,6 +107,59 @@ def iter_items(value: ValueType) -> Iterator[ItemType]:
         yield value
 
 
+def static_value_method(symbol: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wraps an evaluate() or select() method of a token class, so that the
+    method returns the value of the token if it has been evaluated statically.
+    Methods of tokens that are never evaluated statically are returned unchanged.
+    """
+    if symbol not in _STATIC_TOKENS:
+        return func
+    elif func.__name__.startswith('select'):
+        def select(self: 'XPathToken', context: ContextType = None) -> Iterator[ItemType]:
+            if self._static_value is None:
+                return cast(Iterator[ItemType], func(self, context))
+            return iter_items(self._static_value[0])
+
+        return update_wrapper(select, func)
+
+    def evaluate(self: 'XPathToken', context: ContextType = None) -> ValueType:
+        if self._static_value is None:
+            return cast(ValueType, func(self, context))
+        elif isinstance(self._static_value[0], list):
+            return self._static_value[0].copy()
+        return self._static_value[0]
+
+    return update_wrapper(evaluate, func)
+
+
+def _numeric_boolean_value(value: Union[float, Decimal]) -> bool:
+    return False if math.isnan(value) else bool(value)
+
+
+# Effective boolean and string values of the most common atomic types,
+# looked up by exact type before the generic checks.
+_BOOLEAN_VALUE_FUNCTIONS: Dict[type, Callable[[Any], bool]] = {
+    bool: bool,
+    int: bool,
+    str: bool,
+    UntypedAtomic: bool,
+    AnyURI: bool,
+    float: _numeric_boolean_value,
+    Decimal: _numeric_boolean_value,
+    type(None): bool,
+}
+
+_STRING_VALUE_FUNCTIONS: Dict[type, Callable[[Any], str]] = {
+    str: str,
+    int: str,
+    UntypedAtomic: str,
+    AnyURI: str,
+    bool: lambda x: 'true' if x else 'false',
+    type(None): lambda x: '',
+}
+
+
 class XPathToken(Token[XPathTokenType]):
     """Base class for XPath tokens."""
     parser: XPathParserType
@@ -102,11 +167,13 @@ class XPathToken(Token[XPathTokenType]):
     xsd_types: _XsdTypesType
     namespace: Optional[str]
     occurrence: Optional[str]
+    _static_value: Optional[Tuple[ValueType]]
 
     xsd_types = None  # for XPath 2.0+ XML Schema types labeling
     namespace = None  # for namespace binding of names and wildcards
     occurrence = None  # occurrence indicator for item types
     concatenated = False  # a flag for infix operators that can be concatenated
+    _static_value = None  # the value of a statically evaluated token, in a 1-tuple
 
     def evaluate(self, context: ContextType = None) -> ValueType:
         """
@@ -212,12 +279,52 @@ class XPathToken(Token[XPathTokenType]):
             return False
         elif self.symbol == '[':
             return self._items[0].child_axis
+        elif self.symbol == '*':
+            return not self._items  # a wildcard, not the product operator
         elif self.symbol != ':':
             return True
         return not self._items[1].label.endswith('function')
 
     ###
     # Tokens tree analysis methods
+    def evaluate_static_subtrees(self) -> bool:
+        """
+        Evaluates once the subtrees that don't depend on the dynamic context,
+        binding the token roots of these subtrees to their values. Literals
+        are not processed because their evaluation is already trivial.
+        Returns `True` if the whole tree of the token can be evaluated
+        statically, `False` otherwise.
+
+        Used by the parsers after the static evaluation of an expression.
+        """
+        if self.symbol in _LITERAL_TOKENS:
+            return True
+
+        static_items = [tk.evaluate_static_subtrees() for tk in self._items]
+        if self.symbol in _STATIC_TOKENS and all(static_items):
+            if not self.label.endswith('function'):
+                return bool(self._items) or self.symbol == '('  # not a '*' wildcard
+            elif self.namespace in (XPATH_FUNCTIONS_NAMESPACE, None) and \
+                    (self._items or self.symbol in ('true', 'false')):
+                return True  # nullary functions usually use the context item
+
+        for tk, is_static in zip(self._items, static_items):
+            if is_static and tk.symbol not in _LITERAL_TOKENS:
+                tk.bind_static_value()
+        return False
+
+    def bind_static_value(self) -> None:
+        """
+        Evaluates the token without a context and stores the computed value,
+        that is then returned by the evaluate() and select() methods. If the
+        static evaluation raises an error the token is left unchanged, so the
+        error is raised only if the token is evaluated with a dynamic context.
+        """
+        try:
+            self._static_value = self.evaluate(),
+        except (ElementPathError, ArithmeticError, TypeError, ValueError):
+            pass
+
     def iter_leaf_elements(self) -> Iterator[str]:
         """
         Iterates through the leaf elements of the token tree if there are any,
@@ -950,6 +1057,11 @@ class XPathToken(Token[XPathTokenType]):
 
     def cast_to_double(self, value: Union[SupportsFloat, str]) -> float:
         """Cast a value to xs:double."""
+        if type(value) is float:
+            return value
+        elif type(value) is int:
+            return float(value)
+
         try:
             if self.parser.xsd_version == '1.0':
                 return cast(float, DoubleProxy10(value))
@@ -988,7 +1100,12 @@ class XPathToken(Token[XPathTokenType]):
         """
         The effective boolean value, as computed by fn:boolean().
         """
-        if isinstance(obj, list):
+        func = _BOOLEAN_VALUE_FUNCTIONS.get(type(obj))
+        if func is not None:
+            return func(obj)
+        elif isinstance(obj, XPathNode):
+            return True
+        elif isinstance(obj, list):
             if not obj:
                 return False
             elif isinstance(obj[0], XPathNode):
@@ -1018,8 +1135,6 @@ class XPathToken(Token[XPathTokenType]):
             return False if math.isnan(obj) else bool(obj)
         elif obj is None:
             return False
-        elif isinstance(obj, XPathNode):
-            return True
         else:
             message = "effective boolean value is not defined for {!r}.".format(type(obj))
             raise self.error('FORG0006', message)
@@ -1051,8 +1166,9 @@ class XPathToken(Token[XPathTokenType]):
         """
         The string value, as computed by fn:string().
         """
-        if obj is None:
-            return ''
+        func = _STRING_VALUE_FUNCTIONS.get(type(obj))
+        if func is not None:
+            return func(obj)
         elif isinstance(obj, XPathNode):
             return obj.string_value
         elif isinstance(obj, bool):
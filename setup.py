@@ -8,15 +8,44 @@
 #
 # @author Davide Brunato <brunato@sissa.it>
 #
+import os
+import platform
 from setuptools import setup, find_packages
 
 with open("README.rst") as readme:
     long_description = readme.read()
 
+# Optional compilation of the modules of the evaluation hot path with Cython,
+# enabled setting ELEMENTPATH_CYTHONIZE=1 in the build environment. Skipped on
+# other implementations (e.g. PyPy), where the package runs as pure Python.
+ext_modules = []
+if os.environ.get('ELEMENTPATH_CYTHONIZE') == '1' and \
+        platform.python_implementation() == 'CPython':
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        [
+            'elementpath/xpath_tokens.py',
+            'elementpath/xpath1/xpath1_parser.py',
+            'elementpath/xpath1/_xpath1_*.py',
+            'elementpath/xpath2/xpath2_parser.py',
+            'elementpath/xpath2/_xpath2_*.py',
+            'elementpath/xpath_nodes.py',
+            'elementpath/xpath_context.py',
+            'elementpath/tree_builders.py',
+        ],
+        compiler_directives={
+            'language_level': 3,
+            'binding': True,
+            'annotation_typing': False,  # keep pure Python semantics for arguments
+        },
+    )
+
 setup(
     name='elementpath',
     version='4.7.0',
     packages=find_packages(include=['elementpath', 'elementpath.*']),
+    ext_modules=ext_modules,
     package_data={
         'elementpath': ['py.typed'],
         'elementpath.validators': ['analyze-string.xsd', 'schema-for-json.xsd'],
@@ -25,8 +25,8 @@ def elementpath_memory_usage():
 
     # elementpath imports
     #
-    # Note: comments out all subpackages imports in elementpath/__init__.py
-    # to put in evidence the memory consumption of each subpackage.
+    # Note: the package loads its subpackages lazily, so the memory
+    # consumption of each subpackage is put in evidence by its import.
     #
     import elementpath
 
@@ -43,5 +43,26 @@ def elementpath_memory_usage():
     import elementpath.xpath31
 
 
+# noinspection PyUnresolvedReferences
+@profile(precision=3)
+def node_trees_memory_usage():
+    import xml.etree.ElementTree as ElementTree
+    import lxml.etree
+    from elementpath import build_node_tree, build_lxml_node_tree
+
+    source = '<root>{}</root>'.format(
+        ''.join('<a x="{0}"><b>{0}</b> <c/> <b>{0}</b></a>\n'.format(k)
+                for k in range(100000))
+    )
+    root = ElementTree.XML(source)
+    node_tree = build_node_tree(root)
+    del node_tree
+
+    lxml_root = lxml.etree.XML(source)
+    lxml_node_tree = build_lxml_node_tree(lxml_root)
+    del lxml_node_tree
+
+
 if __name__ == '__main__':
     elementpath_memory_usage()
+    node_trees_memory_usage()
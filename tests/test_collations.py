@@ -9,14 +9,30 @@
 # @author Davide Brunato <brunato@sissa.it>
 #
 import unittest
+from unittest.mock import patch
+import locale
 
 from elementpath import ElementPathError
 from elementpath.collations import UNICODE_CODEPOINT_COLLATION, \
-    HTML_ASCII_CASE_INSENSITIVE_COLLATION, CollationManager
+    HTML_ASCII_CASE_INSENSITIVE_COLLATION, XQUERY_TEST_SUITE_CASEBLIND_COLLATION, \
+    UNICODE_COLLATION_BASE_URI, CollationManager
 
 
 class CollationsTest(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # Probe the locale here, not at import, and restore the current one
+        current = locale.setlocale(locale.LC_COLLATE, None)
+        try:
+            locale.setlocale(locale.LC_COLLATE, 'en_US.UTF-8')
+        except locale.Error:
+            cls.has_en_us_locale = False
+        else:
+            cls.has_en_us_locale = True
+        finally:
+            locale.setlocale(locale.LC_COLLATE, current)
+
     def test_context_manager_init(self):
         manager = CollationManager(collation=UNICODE_CODEPOINT_COLLATION)
         self.assertIsInstance(manager, CollationManager)
@@ -43,6 +59,56 @@ class CollationsTest(unittest.TestCase):
         self.assertIn('FOCH0002', str(ctx.exception))
         self.assertIn("Unsupported collation 'unknown'", str(ctx.exception))
 
+    def test_collations_without_locale(self):
+        collations = (UNICODE_CODEPOINT_COLLATION,
+                      HTML_ASCII_CASE_INSENSITIVE_COLLATION,
+                      XQUERY_TEST_SUITE_CASEBLIND_COLLATION)
+
+        with patch.object(locale, 'setlocale') as setlocale:
+            for collation in collations:
+                with self.subTest(collation=collation):
+                    with CollationManager(collation) as manager:
+                        self.assertTrue(manager.eq('a', 'a'))
+
+        setlocale.assert_not_called()
+
+    def test_locale_collation_fallback(self):
+        lc_collate = ('C', None)
+        collations = []
+
+        def setlocale(category, value=None):
+            nonlocal lc_collate
+            if value == ('it_IT', 'UTF-8'):
+                raise locale.Error('unsupported locale setting')
+            lc_collate = value
+
+        def getlocale(category=None):
+            return lc_collate
+
+        collation = f'{UNICODE_COLLATION_BASE_URI}?lang=it_IT'
+        with patch.object(locale, 'setlocale', side_effect=setlocale):
+            with patch.object(locale, 'getlocale', side_effect=getlocale):
+                with CollationManager(collation):
+                    collations.append(lc_collate)
+                collations.append(lc_collate)
+
+                with self.assertRaises(ElementPathError) as ctx:
+                    with CollationManager(collation + ';fallback=no'):
+                        pass
+                collations.append(lc_collate)
+
+        self.assertListEqual(collations, ['en_US.UTF-8', ('C', None), ('C', None)])
+        self.assertIn('FOCH0002', str(ctx.exception))
+
+    def test_locale_collation(self):
+        if not self.has_en_us_locale:
+            self.skipTest("'en_US.UTF-8' locale is not available")
+
+        current = locale.getlocale(locale.LC_COLLATE)
+        with CollationManager('en_US.UTF-8'):
+            self.assertEqual(locale.getlocale(locale.LC_COLLATE), ('en_US', 'UTF-8'))
+        self.assertEqual(locale.getlocale(locale.LC_COLLATE), current)
+
     def test_html_ascii_case_insensitive_collation(self):
         with CollationManager(HTML_ASCII_CASE_INSENSITIVE_COLLATION) as manager:
             self.assertTrue(manager.eq('a', 'A'))
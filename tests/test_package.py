@@ -14,6 +14,10 @@ import fileinput
 import os
 import re
 import platform
+import subprocess
+import sys
+
+import elementpath
 
 
 class PackageTest(unittest.TestCase):
@@ -106,6 +110,28 @@ class PackageTest(unittest.TestCase):
 
         self.assertIsNotNone(min_version, msg="Missing python_requires directive in setup.py")
 
+    def test_lazy_imports(self):
+        self.assertListEqual(sorted(set(elementpath.__all__) - set(dir(elementpath))), [])
+        for name in elementpath.__all__:
+            self.assertIsNotNone(getattr(elementpath, name))
+
+        with self.assertRaises(AttributeError):
+            getattr(elementpath, 'unknown')
+
+        code = "import sys, elementpath; print('elementpath.xpath2' in sys.modules)"
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True,
+                                cwd=self.package_dir, text=True)
+        self.assertEqual(result.stdout.strip(), 'False')
+
+        # Submodules are available as attributes after a plain package import
+        submodules = ('xpath_nodes', 'xpath1', 'xpath2', 'xpath_context', 'tree_builders',
+                      'xpath_tokens', 'regex', 'sequence_types')
+        code = "import elementpath; print([type(getattr(elementpath, name)).__name__ " \
+               f"for name in {submodules!r}])"
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True,
+                                cwd=self.package_dir, text=True)
+        self.assertEqual(result.stdout.strip(), str(['module'] * len(submodules)))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -23,7 +23,7 @@ from unicodedata import category, unidata_version
 
 from elementpath.regex import RegexError, CharacterClass, translate_pattern, \
     UnicodeSubset, unicode_category, unicode_block, install_unicode_data, \
-    unicode_version, UnicodeData
+    unicode_version, UnicodeData, compile_pattern
 from elementpath.regex.codepoints import code_point_repr, iter_code_points, \
     iterparse_character_subset
 
@@ -799,6 +799,23 @@ class TestPatterns(unittest.TestCase):
         self.assertIsNone(pattern.search('first\tsecond\tthird'))
         self.assertEqual(pattern.search('first second third').group(0), 'first second third')
 
+    def test_compile_pattern(self):
+        compile_pattern.cache_clear()
+        pattern = compile_pattern('[^\n\t]+', anchors=False)
+        self.assertEqual(pattern.pattern, '^([^\t\n]+)$(?!\\n\\Z)')
+        self.assertIs(compile_pattern('[^\n\t]+', anchors=False), pattern)
+        self.assertIsNot(compile_pattern('[^\n\t]+'), pattern)
+
+        pattern = compile_pattern('^abc$', flags=re.IGNORECASE)
+        self.assertEqual(pattern.flags & re.IGNORECASE, re.IGNORECASE)
+        self.assertIsNotNone(pattern.search('ABC'))
+
+        with self.assertRaises(RegexError):
+            compile_pattern('[a')
+
+        install_unicode_data()
+        self.assertEqual(compile_pattern.cache_info().currsize, 0)
+
     def test_dot_wildcard(self):
         regex = translate_pattern('.+', anchors=False)
         self.assertEqual(regex, '^([^\\r\\n]+)$(?!\\n\\Z)')
@@ -9,15 +9,30 @@
 # @author Davide Brunato <brunato@sissa.it>
 #
 import unittest
+import gc
+import os
+import pickle
+import tempfile
+import weakref
 import xml.etree.ElementTree as ElementTree
+from unittest.mock import patch
 
-from elementpath import select, iter_select, Selector, XPath2Parser
+from elementpath import select, iter_select, Selector, XPath1Parser, XPath2Parser, \
+    XPathContext, clear_xpath_cache
+from elementpath import _disk_cache
+from elementpath.xpath30 import XPath30Parser
 
 try:
     import lxml.etree as lxml_etree
 except ImportError:
     lxml_etree = None
 
+try:
+    import xmlschema
+    from xmlschema.xpath import XMLSchemaProxy
+except (ImportError, AttributeError):
+    xmlschema = None
+
 
 class XPathSelectorsTest(unittest.TestCase):
     etree = ElementTree
@@ -112,6 +127,167 @@ class XPathSelectorsTest(unittest.TestCase):
         self.assertEqual(select(root1, query, fragment=False), root1[0][:])
         self.assertEqual(select(root2, query, fragment=False), root2[0][:])
 
+    def test_parsed_paths_cache(self):
+        clear_xpath_cache()
+        namespaces = {'ns': 'http://xpath.test/ns'}
+        selector = Selector('/A/B[1]/C', namespaces=namespaces)
+        with patch.object(XPath2Parser, 'parse', autospec=True,
+                          side_effect=XPath2Parser.parse) as parse_method:
+            other = Selector('/A/B[1]/C', namespaces=namespaces)
+            parse_method.assert_not_called()
+
+            # Each selector has its own tokens tree and parser
+            self.assertIsNot(other.root_token, selector.root_token)
+            self.assertIsNot(other.parser, selector.parser)
+            self.assertEqual(other.root_token.tree, selector.root_token.tree)
+            self.assertEqual(other.namespaces, selector.namespaces)
+
+            Selector('/A/B[1]/C')
+            Selector('/A/B[1]/C', strict=False)
+            self.assertEqual(parse_method.call_count, 2)
+
+        clear_xpath_cache()
+        with patch.object(XPath2Parser, 'parse', autospec=True,
+                          side_effect=XPath2Parser.parse) as parse_method:
+            Selector('/A/B[1]/C', namespaces=namespaces)
+            parse_method.assert_called_once()
+
+        # Unhashable arguments bypass the cache
+        selector = Selector('$a', variable_types={'a': 'xs:decimal'})
+        with patch.object(XPath2Parser, 'parse', autospec=True,
+                          side_effect=XPath2Parser.parse) as parse_method:
+            Selector('$a', variable_types={'a': 'xs:decimal'})
+            parse_method.assert_called_once()
+        self.assertListEqual(select(self.root, 'text()'), ['Dickens'])
+
+    @unittest.skipIf(xmlschema is None, "xmlschema library is not installed")
+    def test_schema_bound_selectors(self):
+        schema = xmlschema.XMLSchema(
+            '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+            '  <xs:element name="author" type="xs:string"/>'
+            '</xs:schema>'
+        )
+        schema_proxy = XMLSchemaProxy(schema)
+
+        clear_xpath_cache()
+        selector = Selector('/author', schema=schema_proxy)
+        self.assertIs(selector.parser.schema, schema_proxy)
+        self.assertIs(Selector('/author', schema=schema_proxy).parser.schema, schema_proxy)
+        self.assertListEqual(selector.select(self.root), [self.root])
+        self.assertListEqual(select(self.root, 'text()', schema=schema_proxy), ['Dickens'])
+
+    def test_cached_paths_evaluation_state(self):
+        clear_xpath_cache()
+        context = XPathContext(self.root)
+        path = 'function($a) { $a + $x }'
+        f1 = select(self.root, path, parser=XPath30Parser, variables={'x': 1})[0]
+        self.assertEqual(f1(10, context=context), 11)
+
+        f2 = select(self.root, path, parser=XPath30Parser, variables={'x': 100})[0]
+        self.assertIsNot(f2, f1)
+        self.assertEqual(f2(10, context=context), 110)
+        self.assertEqual(f1(10, context=context), 11)
+
+        f3 = next(iter_select(self.root, path, parser=XPath30Parser, variables={'x': 5}))
+        self.assertEqual(f3(10, context=context), 15)
+        self.assertEqual(f1(10, context=context), 11)
+
+    def test_parsed_paths_disk_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with patch.dict(os.environ, {'ELEMENTPATH_CACHE_DIR': cache_dir}):
+                clear_xpath_cache()
+                self.assertEqual(select(self.root, 'concat(., "!")'), 'Dickens!')
+                self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+                clear_xpath_cache()
+                with patch.object(XPath2Parser, 'parse') as parse_method:
+                    selector = Selector('concat(., "!")')
+                    self.assertEqual(selector.select(self.root), 'Dickens!')
+                    parse_method.assert_not_called()
+
+                clear_xpath_cache()
+                self.assertListEqual(select(self.root, 'text()', parser=XPath1Parser),
+                                     ['Dickens'])
+                self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+                # Corrupted entries are replaced
+                for filename in os.listdir(cache_dir):
+                    with open(os.path.join(cache_dir, filename), 'wb') as fp:
+                        fp.write(b'not a pickle')
+
+                clear_xpath_cache()
+                self.assertListEqual(select(self.root, 'text()', parser=XPath1Parser),
+                                     ['Dickens'])
+                self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+                # Loaded trees are not shared between calls
+                context = XPathContext(self.root)
+                path = 'function($a) { $a + $x }'
+                for _ in range(2):
+                    clear_xpath_cache()
+                    f1 = select(self.root, path, parser=XPath30Parser, variables={'x': 1})[0]
+                    f2 = select(self.root, path, parser=XPath30Parser, variables={'x': 100})[0]
+                    self.assertEqual(f1(10, context=context), 11)
+                    self.assertEqual(f2(10, context=context), 110)
+                self.assertEqual(len(os.listdir(cache_dir)), 3)
+
+        clear_xpath_cache()
+
+    def test_parsed_paths_disk_cache_limits(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # Paths parsed with options that are not plain values are not stored
+            options = (('variable_types', {'a': 'xs:string'}),)
+            data = _disk_cache.load_or_parse(cache_dir, '$a', XPath2Parser, None, options)
+            self.assertEqual(pickle.loads(data).source, '$a')
+            self.assertListEqual(os.listdir(cache_dir), [])
+
+            with patch.object(_disk_cache, 'MAX_ENTRIES', 2):
+                for path in ('a', 'b', 'c'):
+                    _disk_cache.load_or_parse(cache_dir, path, XPath2Parser, None, ())
+                self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+            for filename in os.listdir(cache_dir):
+                os.utime(os.path.join(cache_dir, filename), (0, 0))
+            _disk_cache.load_or_parse(cache_dir, 'd', XPath2Parser, None, ())
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+    def test_shared_selectors(self):
+        namespaces = {'ns': 'http://xpath.test/ns'}
+        selector = Selector.get('/A/B[1]/C', namespaces=namespaces)
+        self.assertIs(Selector.get('/A/B[1]/C', namespaces=namespaces), selector)
+        self.assertIsNot(Selector.get('/A/B[1]/C'), selector)
+        self.assertIsNot(Selector.get('/A/B[1]/C', namespaces, XPath1Parser), selector)
+        self.assertIsNot(Selector('/A/B[1]/C', namespaces=namespaces), selector)
+
+        # Selectors not shared by get() have their own tree and parser
+        other = Selector('/A/B[1]/C', namespaces=namespaces)
+        self.assertIsNot(other.root_token, selector.root_token)
+        self.assertIsNot(other.parser, selector.parser)
+        other.namespaces['tns'] = 'http://xpath.test/tns'
+        self.assertNotIn('tns', selector.namespaces)
+        self.assertNotIn('tns', Selector.get('/A/B[1]/C').namespaces)
+        del other
+
+        selector_ref = weakref.ref(selector)
+        del selector
+        gc.collect()
+        self.assertIsNone(selector_ref())
+
+        selector = Selector.get('text()')
+        self.assertListEqual(selector.select(self.root), ['Dickens'])
+
+        selector = Selector.get('$a', variables={'a': 1})
+        self.assertIsNot(Selector.get('$a', variables={'a': 1}), selector)
+        self.assertEqual(selector.select(self.root), 1)
+
+        context = XPathContext(self.root)
+        path = 'function($a) { $a + $x }'
+        selector = Selector.get(path, parser=XPath30Parser)
+        f1 = selector.select(self.root, variables={'x': 1})[0]
+        f2 = Selector(path, parser=XPath30Parser).select(self.root, variables={'x': 100})[0]
+        self.assertEqual(f1(10, context=context), 11)
+        self.assertEqual(f2(10, context=context), 110)
+
 
 @unittest.skipIf(lxml_etree is None, "The lxml library is not installed")
 class LxmlXPathSelectorsTest(XPathSelectorsTest):
@@ -139,6 +139,16 @@ class TdopParserTest(unittest.TestCase):
         token = self.parser.parse('10 + 6')
         self.assertEqual(token.evaluate(), 16)
 
+    def test_token_children_iteration(self):
+        token = self.parser.parse('9 + 7 - 5')
+        self.assertListEqual([tk.source for tk in token], ['9 + 7', '5'])
+        self.assertListEqual([tk.source for tk in reversed(token)], ['5', '9 + 7'])
+        self.assertIn(token[1], token)
+        self.assertEqual(token.index(token[1]), 1)
+
+        token[:] = token[0],
+        self.assertListEqual([tk.source for tk in token], ['9 + 7'])
+
     def test_iter_method(self):
         token = self.parser.parse('9 + 7 - 5')
 
@@ -341,6 +351,20 @@ class TdopParserTest(unittest.TestCase):
         self.assertIn("Token class ", str(ec.exception))
         self.assertIn("is not registered", str(ec.exception))
 
+    def test_interned_symbols(self):
+
+        class AnotherParser(Parser):
+            SYMBOLS = {'(integer)', '(name)', 'descendant-or-self'}
+
+        symbol = ''.join(['descendant', '-or-', 'self'])
+        token_class = AnotherParser.register(symbol)
+        self.assertIs(token_class.symbol, sys.intern('descendant-or-self'))
+        self.assertIs(token_class.lookup_name, token_class.symbol)
+
+        for symbol, token_class in self.parser.symbol_table.items():
+            self.assertIs(token_class.symbol, sys.intern(token_class.symbol))
+            self.assertIs(symbol, sys.intern(symbol))
+
     def test_other_operators(self):
 
         class ExpressionParser(Parser):
@@ -74,6 +74,44 @@ class TreeBuildersTest(unittest.TestCase):
         for k, node in enumerate(node.iter(), start=1):
             self.assertEqual(k, node.position, msg=node)
 
+    def test_build_node_tree_without_namespaces(self):
+        root = ElementTree.XML(XML_DATA)
+        node = build_node_tree(root)
+
+        self.assertEqual(node.nsmap, {})
+        for child in node.iter():
+            if isinstance(child, ElementNode):
+                self.assertIs(child.nsmap, node.nsmap)
+
+        for k, child in enumerate(node.iter(), start=1):
+            self.assertEqual(k, child.position, msg=child)
+
+    def test_build_node_tree_with_nsmap_elements(self):
+        class NsmapElement(ElementTree.Element):
+            nsmap = {'p': 'urn:p'}
+
+        root = NsmapElement('r')
+        root.append(NsmapElement('{urn:p}a'))
+        node = build_node_tree(root)
+
+        self.assertEqual(node.nsmap, {'p': 'urn:p'})
+        self.assertEqual(node.children[0].nsmap, {'p': 'urn:p'})
+
+        node = build_node_tree(root, namespaces={})
+        self.assertEqual(node.nsmap, {})
+
+    @unittest.skipIf(lxml_etree is None, "lxml library is not installed")
+    def test_build_node_tree_with_lxml_element(self):
+        root = lxml_etree.XML('<r xmlns:p="urn:p"><p:a/></r>')
+        node = build_node_tree(root)
+
+        self.assertEqual(node.nsmap, {'p': 'urn:p'})
+        self.assertEqual(node.children[0].nsmap, {'p': 'urn:p'})
+        self.assertListEqual(
+            [ns.uri for ns in node.namespace_nodes],
+            ['http://www.w3.org/XML/1998/namespace', 'urn:p']
+        )
+
     def test_build_node_tree_with_element_tree(self):
         root = ElementTree.parse(io.StringIO(XML_DATA))
         node = build_node_tree(root, self.namespaces)
@@ -1249,6 +1249,44 @@ class XPath1ParserTest(xpath_test_class.XPathTestCase):
         self.check_selector('/A/B1/@a | /A/@a', root, ['1', '2', '3', '4'])
         self.check_selector('/A/B1/@a | /A/B2/@a', root, ['2', '3', '4', '5'])
 
+    def test_path_step_chains(self):
+        root = self.etree.XML('<A><B><C/><C><B><C/></B></C></B><D/><B><C/></B></A>')
+        document = self.etree.ElementTree(root)
+        c_elements = [root[0][0], root[0][1], root[2][0]]
+
+        self.check_selector('/A/B/C', root, c_elements)
+        self.check_selector('/A/B/C', document, c_elements)
+        self.check_selector('B/C', root, c_elements)
+        self.check_selector('B/C/B/C', root, [root[0][1][0][0]])
+        self.check_selector('//B/C', root,
+                            [root[0][0], root[0][1], root[0][1][0][0], root[2][0]])
+        self.check_selector('/A/B/C/D', root, [])
+        self.check_selector('/A/D/C', root, [])
+
+        root = self.etree.XML('<A xmlns="ns"><B><C/></B></A>')
+        self.check_selector('/A/B/C', root, [])
+        if self.parser.version > '1.0':
+            self.check_selector('/A/B/C', root, [root[0][0]], namespaces={'': 'ns'})
+            self.check_selector('(/A, /A)/B/C', root, [root[0][0]], namespaces={'': 'ns'})
+            self.wrong_type('(1, 2)/B/C', 'XPTY0019', context=XPathContext(root))
+
+    def test_path_step_chains_with_xsd_types(self):
+        root = self.etree.XML('<A><B><C/></B><D/><B><C/></B></A>')
+        token = self.parser.parse('/A/B/C')
+        nodes = [x for x in token.select(XPathContext(root))]
+        self.assertListEqual([x.elem for x in nodes], [root[0][0], root[2][0]])
+        self.assertTrue(all(x.xsd_type is None for x in nodes))
+
+        # Steps bound to XSD types aren't fused and set the types of the nodes
+        xsd_type = object()
+        token = self.parser.parse('/A/B/C')
+        for tk in token.iter('(name)'):
+            tk.xsd_types = {tk.value: xsd_type}
+
+        typed_nodes = [x for x in token.select(XPathContext(root))]
+        self.assertListEqual([x.elem for x in typed_nodes], [x.elem for x in nodes])
+        self.assertTrue(all(x.xsd_type is xsd_type for x in typed_nodes))
+
     def test_context_item_expression(self):
         root = self.etree.XML('<A><B1><C/></B1><B2/><B3><C1/><C2/></B3></A>')
         self.check_selector('.', root, [root])
@@ -1311,6 +1349,10 @@ class XPath1ParserTest(xpath_test_class.XPathTestCase):
         self.check_selector('//C', root, [root[0][0], root[2][0]])
         self.check_selector('//*', root, [e for e in root.iter()])
 
+        root = self.etree.XML('<A>a<B1>b<C/><!--c--></B1><B2/></A>')
+        self.check_selector('//text()', root, ['a', 'b'])
+        self.check_selector('//C', root, [root[0][0]])
+
         self.check_value('/1//*', TypeError, context=XPathContext(root))
 
         # Issue #14
@@ -1502,6 +1544,17 @@ class XPath1ParserTest(xpath_test_class.XPathTestCase):
         self.check_selector('/A/*[position()<2]', root, [root[0]])
         self.check_selector('/A/*[last()-1]', root, [root[0]])
         self.check_selector('/A/B2/*[position()>=2]', root, root[1][1:])
+        self.check_selector('/A/B2/*[2.0]', root, [root[1][1]])
+        self.check_selector('/A/B2/*[2.5]', root, [])
+        self.check_selector('/A/B2/*[0]', root, [])
+        self.check_selector('/A/*/*[3]', root, [root[0][2], root[1][2]])
+        self.check_selector('/A/*/*[last()]', root, [root[0][2], root[1][3]])
+        self.check_selector('/A/B2/*[position() mod 2 = 0]', root, [root[1][1], root[1][3]])
+        self.check_selector('/A/B2/*[last() - position()]', root, [root[1][1]])
+        self.check_selector('/A/B2/*[position() > 1 and not(position() = last())]',
+                            root, root[1][1:3])
+        self.check_selector('/A/*[*]', root, root[:])
+        self.check_selector('/A/B2/*[* * 2]', root, [])
 
         root = self.etree.XML("<bib><book><author>Asimov</author></book></bib>")
         self.check_selector("book/author[. = 'Asimov']", root, [root[0][0]])
@@ -21,7 +21,7 @@ except ImportError:
     lxml_html = None
 
 from elementpath import XPathContext, DocumentNode, ElementNode, datatypes, \
-    select, get_node_tree, TextNode
+    select, get_node_tree, TextNode, XPath2Parser
 
 
 class DummyXsdType:
@@ -66,6 +66,21 @@ class XPathContextTest(unittest.TestCase):
         self.assertIsInstance(copy(context), XPathContext)
         self.assertIsNot(copy(context), context)
 
+    def test_copy_on_write_variables(self):
+        root = ElementTree.XML('<A/>')
+        context = XPathContext(root, variables={'a': 1})
+        context_copy = copy(context)
+        self.assertIs(context_copy.variables, context.variables)
+
+        context_copy.bind_variables([('a', 2), ('b', 3)])
+        self.assertDictEqual(context_copy.variables, {'a': 2, 'b': 3})
+        self.assertDictEqual(context.variables, {'a': 1})
+
+        parser = XPath2Parser(variable_types={'a': 'xs:integer'})
+        token = parser.parse('for $a in (2, 3) return $a * 2')
+        self.assertListEqual(token.get_results(context), [4, 6])
+        self.assertDictEqual(context.variables, {'a': 1})
+
     @unittest.skipIf(lxml_etree is None, 'lxml library is not installed')
     def test_etree_property(self):
         root = ElementTree.XML('<root/>')
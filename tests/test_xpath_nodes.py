@@ -209,6 +209,32 @@ class XPathNodesTest(unittest.TestCase):
             attribute.xsd_type = xsd_type
             self.assertEqual(attribute.as_item(), ('value', '10'))
 
+    def test_node_slots(self):
+        root = ElementTree.XML('<A a="1">text<!-- comment --><?pi data?></A>')
+        document = ElementTree.ElementTree(root)
+        for node in XPathContext(document).root.iter():
+            with self.subTest(node=node):
+                if isinstance(node, ElementNode):
+                    self.assertDictEqual(vars(node), {})
+                else:
+                    self.assertFalse(hasattr(node, '__dict__'))
+
+        node = ElementNode(root)
+        self.assertIsNone(node.uri)
+        node.custom_attribute = 1  # element nodes can be extended
+        self.assertDictEqual(vars(node), {'custom_attribute': 1})
+
+    @unittest.skipIf(xmlschema is None, "xmlschema library required.")
+    def test_schema_element_node_slots(self):
+        schema = xmlschema.XMLSchema(dedent("""\
+            <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+              <xs:element name="root" type="xs:int"/>
+            </xs:schema>"""))
+
+        root_node = XPathSchemaContext(schema).root
+        self.assertDictEqual(vars(root_node), {})
+        self.assertIsNone(root_node.ref)
+
     def test_typed_element_nodes(self):
         element = ElementTree.Element('schema')
 
@@ -386,6 +412,9 @@ class XPathNodesTest(unittest.TestCase):
             list(e.elem for e in context.root.iter() if isinstance(e, ElementNode)),
             list(root.iter())
         )
+        self.assertListEqual(list(context.root), context.root.children)
+        self.assertListEqual(list(context.root[0]), [context.root[0][0]])
+        self.assertListEqual(list(context.root[1]), [])
 
     def test_document_node_iter(self):
         root = ElementTree.XML('<A><B1><C1/></B1><B2/><B3><C1/><C2/></B3></A>')
@@ -396,6 +425,7 @@ class XPathNodesTest(unittest.TestCase):
             list(e.elem for e in context.root.iter() if isinstance(e, ElementNode)),
             list(doc.iter())
         )
+        self.assertListEqual(list(context.root), [context.root[0]])
 
     @unittest.skipIf(lxml_etree is None, 'lxml.etree is not installed')
     def test_lazy_attributes_iter__issue_72(self):
@@ -9,19 +9,20 @@
 # @author Davide Brunato <brunato@sissa.it>
 #
 import unittest
-from unittest.mock import patch
 import io
 import math
+import pickle
 import xml.etree.ElementTree as ElementTree
 from collections import namedtuple
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import zip_longest
 from decimal import Decimal
 
 try:
     import xmlschema
 except ImportError:
     xmlschema = None
-else:
-    xmlschema.XMLSchema.meta_schema.build()
 
 from elementpath.exceptions import MissingContextError
 from elementpath.datatypes import UntypedAtomic, Int
@@ -29,13 +30,54 @@ from elementpath.namespaces import XSD_NAMESPACE, XPATH_FUNCTIONS_NAMESPACE
 from elementpath.xpath_nodes import ElementNode, AttributeNode, NamespaceNode, \
     CommentNode, ProcessingInstructionNode, TextNode, DocumentNode
 from elementpath.helpers import ordinal
+from elementpath import select
 from elementpath.xpath_context import XPathContext, XPathSchemaContext
 from elementpath.xpath1 import XPath1Parser
 from elementpath.xpath2 import XPath2Parser
 from elementpath.xpath3 import XPath30Parser, XPath31Parser
 
 
+@lru_cache(maxsize=None)
+def get_parser(parser_class):
+    """
+    Returns a parser instance shared by the test classes. Tests that change
+    the parser (e.g. setting a schema) have to restore it at the end.
+    """
+    return parser_class(namespaces={'xs': XSD_NAMESPACE, 'tst': "http://xpath.test/ns"})
+
+
+@lru_cache(maxsize=None)
+def get_schema(source):
+    """Returns a schema instance shared by the test classes."""
+    return xmlschema.XMLSchema(source)
+
+
+@lru_cache(maxsize=None)
+def get_schema_proxy(schema, base_element=None):
+    """Returns a schema proxy shared by the tests binding the same schema."""
+    return xmlschema.xpath.XMLSchemaProxy(schema, base_element)
+
+
+_parsed_tokens = {}
+
+
+def cached_parse(parser, expression):
+    """
+    Parses an expression once for each parser instance and schema binding. Use it
+    only in tests that don't change the returned token tree. The parser and the
+    schema are kept in the cache, so their ids are not reused by other instances.
+    """
+    key = id(parser), id(parser.schema), expression
+    try:
+        return _parsed_tokens[key][-1]
+    except KeyError:
+        token = parser.parse(expression)
+        _parsed_tokens[key] = parser, parser.schema, token
+        return token
+
+
 class DummyXsdType:
+    __slots__ = ()
     name = local_name = None
 
     @property
@@ -61,7 +103,24 @@ class DummyXsdType:
         return int(obj)
 
 
+class DummySimpleContentType(DummyXsdType):
+    __slots__ = ()
+
+    def is_simple(self): return False
+    def has_simple_content(self): return True
+
+
+class DummySimpleType(DummyXsdType):
+    __slots__ = ()
+
+    def is_simple(self): return True
+
+
+XsdElementStub = namedtuple('XsdElement', 'name xsd_version type')
+
+
 class Tagged(object):
+    __slots__ = ()
     tag = 'root'
 
     def __repr__(self):
@@ -70,9 +129,49 @@ class Tagged(object):
 
 class XPath1TokenTest(unittest.TestCase):
 
+    # A context shared by tests that only change its item, reset with reset_context().
+    elem = ElementTree.Element('A', attrib={'max': '30'})
+    elem.text = '10'
+    context = XPathContext(elem)
+
+    # XML fixtures that are only read by the tests
+    mixed_elem = ElementTree.XML('<root>a<e1>b</e1>c<e2>d</e2>e</root>')
+    mixed_doc = ElementTree.parse(io.StringIO('<root>a<e1>b</e1>c<e2>d</e2>e</root>'))
+    text_doc = ElementTree.parse(io.StringIO('<A>123<B1>456</B1><B2>789</B2></A>'))
+
+    # Parentless nodes that are only read by the tests
+    attribute_node = AttributeNode('id', '0212349350')
+    namespace_node = NamespaceNode('xs', 'http://www.w3.org/2001/XMLSchema')
+    comment_node = CommentNode(ElementTree.Comment('nothing important'))
+    pi_node = ProcessingInstructionNode(
+        ElementTree.ProcessingInstruction('action', 'nothing to do')
+    )
+    text_node = TextNode('betelgeuse')
+
     @classmethod
     def setUpClass(cls):
-        cls.parser = XPath1Parser(namespaces={'xs': XSD_NAMESPACE, 'tst': "http://xpath.test/ns"})
+        cls.parser = get_parser(XPath1Parser)
+
+    def assertYields(self, iterator, expected):
+        """Checks the items of an iterator, stopping at the first mismatch."""
+        sentinel = object()
+        items = zip_longest(iterator, expected, fillvalue=sentinel)
+        for k, (item, expected_item) in enumerate(items):
+            if item is sentinel:
+                self.fail(f"missing item {expected_item!r} at position {k}")
+            elif expected_item is sentinel:
+                self.fail(f"unexpected item {item!r} at position {k}")
+            self.assertEqual(item, expected_item, f"mismatch at position {k}")
+
+    def reset_context(self):
+        context = self.context
+        context.item = context.root
+        context.position = context.size = 1
+        context.axis = None
+        context.root.xsd_type = None
+        for attribute in context.root.attributes:
+            attribute.xsd_type = None
+        return context
 
     def test_ordinal_function(self):
         self.assertEqual(ordinal(1), '1st')
@@ -82,25 +181,27 @@ class XPath1TokenTest(unittest.TestCase):
         self.assertEqual(ordinal(11), '11th')
         self.assertEqual(ordinal(23), '23rd')
         self.assertEqual(ordinal(34), '34th')
+        self.assertEqual(ordinal(101), '101st')
+        self.assertEqual(ordinal(112), '112th')
 
     def test_arity_property(self):
-        token = self.parser.parse('true()')
+        token = cached_parse(self.parser, 'true()')
         self.assertEqual(token.symbol, 'true')
         self.assertEqual(token.label, 'function')
         self.assertEqual(token.arity, 0)
 
-        token = self.parser.parse('2 + 5')
+        token = cached_parse(self.parser, '2 + 5')
         self.assertEqual(token.symbol, '+')
         self.assertEqual(token.label, 'operator')
         self.assertEqual(token.arity, 2)
 
     def test_source_property(self):
-        token = self.parser.parse('last()')
+        token = cached_parse(self.parser, 'last()')
         self.assertEqual(token.symbol, 'last')
         self.assertEqual(token.label, 'function')
         self.assertEqual(token.source, 'last()')
 
-        token = self.parser.parse('2.0')
+        token = cached_parse(self.parser, '2.0')
         self.assertEqual(token.symbol, '(decimal)')
         self.assertEqual(token.label, 'literal')
         self.assertEqual(token.source, '2.0')
@@ -115,35 +216,95 @@ class XPath1TokenTest(unittest.TestCase):
         token = parser.parse("(: Comment line :)\n\n (1, 2, 3, 4)")
         self.assertEqual(token.symbol, '(')
         self.assertEqual(token.position, (3, 2))
+        self.assertListEqual([tk.position for tk in token.iter('(integer)')],
+                             [(3, 3), (3, 6), (3, 9), (3, 12)])
+
+        token = parser.parse("(1,\n  (: a\n nested (: comment :) :)\n2)")
+        self.assertEqual(token.position, (1, 1))
+        tokens = list(token.iter('(integer)'))
+        self.assertListEqual([tk.position for tk in tokens], [(1, 2), (4, 1)])
+        self.assertFalse(tokens[0].is_line_start())
+        self.assertTrue(tokens[1].is_line_start())
 
     def test_iter_method(self):
-        token = self.parser.parse('2 + 5')
+        token = cached_parse(self.parser, '2 + 5')
         items = [tk for tk in token.iter()]
         self.assertListEqual(items, [token[0], token, token[1]])
 
-        token = self.parser.parse('/A/B[C]/D/@a')
+        token = cached_parse(self.parser, '/A/B[C]/D/@a')
         self.assertEqual(token.tree, '(/ (/ (/ (/ (A)) ([ (B) (C))) (D)) (@ (a)))')
-        self.assertListEqual(list(tk.value for tk in token.iter()),
+        tokens = list(token.iter())
+        self.assertListEqual([tk.value for tk in tokens],
                              ['/', 'A', '/', 'B', '[', 'C', '/', 'D', '/', '@', 'a'])
-        self.assertListEqual(list(tk.value for tk in token.iter('(name)')),
+        self.assertListEqual([tk.value for tk in tokens if tk.symbol == '(name)'],
                              ['A', 'B', 'C', 'D', 'a'])
-
-        self.assertListEqual(list(tk.source for tk in token.iter('/')),
+        self.assertListEqual([tk.source for tk in tokens if tk.symbol == '/'],
                              ['/A', '/A/B[C]', '/A/B[C]/D', '/A/B[C]/D/@a'])
 
+        # Filtering by symbols selects the same tokens of the full iteration
+        for symbols in [('(name)',), ('/',), ('/', '['), ('@', '(name)')]:
+            self.assertYields(token.iter(*symbols),
+                              [tk for tk in tokens if tk.symbol in symbols])
+
     def test_iter_leaf_elements_method(self):
-        token = self.parser.parse('2 + 5')
-        self.assertListEqual(list(token.iter_leaf_elements()), [])
+        token = cached_parse(self.parser, '2 + 5')
+        self.assertYields(token.iter_leaf_elements(), [])
 
-        token = self.parser.parse('/A/B[C]/D/@a')
-        self.assertListEqual(list(token.iter_leaf_elements()), [])
+        token = cached_parse(self.parser, '/A/B[C]/D/@a')
+        self.assertYields(token.iter_leaf_elements(), [])
 
-        token = self.parser.parse('/A/B[C]/D')
-        self.assertListEqual(list(token.iter_leaf_elements()), ['D'])
+        token = cached_parse(self.parser, '/A/B[C]/D')
+        self.assertYields(token.iter_leaf_elements(), ['D'])
 
-        token = self.parser.parse('/A/B[C]')
+        token = cached_parse(self.parser, '/A/B[C]')
         self.assertEqual(token.tree, '(/ (/ (A)) ([ (B) (C)))')
-        self.assertListEqual(list(token.iter_leaf_elements()), ['B'])
+        self.assertYields(token.iter_leaf_elements(), ['B'])
+
+    def test_evaluate_static_subtrees(self):
+        root = ElementTree.XML('<A><B x="ab2"/><B x="ab1"/></A>')
+
+        token = self.parser.parse('B[@x = concat("a", "b", string(1 + 1))]')
+        self.assertFalse(token.evaluate_static_subtrees())
+        concat_token = token[1][1]
+        self.assertEqual(concat_token.symbol, 'concat')
+        self.assertTupleEqual(vars(concat_token)['_static_value'], ('ab2',))
+        self.assertIs(type(concat_token), self.parser.symbol_table['concat'])
+        self.assertNotIn('evaluate', vars(concat_token))
+        self.assertNotIn('_static_value', vars(token[1]))
+        self.assertNotIn('_static_value', vars(concat_token[0]))
+        self.assertEqual(concat_token.evaluate(), 'ab2')
+        self.assertYields(concat_token.select(), ['ab2'])
+        self.assertListEqual(select(root, token.source, parser=type(self.parser)), [root[0]])
+
+        token = pickle.loads(pickle.dumps(token))
+        self.assertIs(type(token[1][1]), type(concat_token))
+        self.assertEqual(token[1][1].evaluate(), 'ab2')
+        self.assertListEqual(token.get_results(XPathContext(root)), [root[0]])
+
+        token = self.parser.parse('(1 + 2) * 3')
+        self.assertIn('_static_value', vars(token))
+        self.assertEqual(token.evaluate(), 9)
+
+        if self.parser.version != '1.0':
+            token = self.parser.parse('(1, 2)')
+            token.evaluate().append(3)
+            self.assertListEqual(token.evaluate(), [1, 2])
+            self.assertYields(token.select(), [1, 2])
+
+        for path in ('*', 'count(*)', 'string()', '. = concat("a", "b")'):
+            token = self.parser.parse(path)
+            self.assertNotIn('_static_value', vars(token), msg=path)
+
+        # Errors of static subtrees are raised only at dynamic evaluation
+        token = self.parser.parse('B[false() and 1 div 0]')
+        self.assertListEqual(token.get_results(XPathContext(root)), [])
+
+    def test_child_axis_property(self):
+        for path in ('A', '*', 'text()', 'node()', 'B[1]', 'child::B'):
+            self.assertTrue(cached_parse(self.parser, path).child_axis, msg=path)
+
+        for path in ('@a', '.', '..', '/A', 'true()', '2 * 3'):
+            self.assertFalse(cached_parse(self.parser, path).child_axis, msg=path)
 
     def test_get_argument_method(self):
         token = self.parser.symbol_table['true'](self.parser)
@@ -152,40 +313,42 @@ class XPath1TokenTest(unittest.TestCase):
         with self.assertRaises(TypeError):
             token.get_argument(1, required=True)
 
-    @patch.multiple(DummyXsdType,
-                    is_simple=lambda x: False,
-                    has_simple_content=lambda x: True)
     def test_select_results(self):
-        token = self.parser.parse('.')
-        elem = ElementTree.Element('A', attrib={'max': '30'})
-        elem.text = '10'
-        xsd_type = DummyXsdType()
+        token = cached_parse(self.parser, '.')
+        elem = self.elem
+        xsd_type = DummySimpleContentType()
 
-        context = XPathContext(elem)
-        self.assertListEqual(list(token.select_results(context)), [elem])
+        try:
+            context = self.reset_context()
+            self.assertYields(token.select_results(context), [elem])
 
-        context = XPathContext(elem, item=elem)
-        context.root.xsd_type = xsd_type
-        self.assertListEqual(list(token.select_results(context)), [elem])
+            context.root.xsd_type = xsd_type
+            self.assertYields(token.select_results(context), [elem])
 
-        context = XPathContext(elem)
-        context.item = context.root.attributes[0]
-        self.assertListEqual(list(token.select_results(context)), ['30'])
+            context = self.reset_context()
+            context.item = context.root.attributes[0]
+            self.assertYields(token.select_results(context), ['30'])
 
-        context = XPathContext(elem)
-        context.item = context.root.attributes[0]
-        context.item.xsd_type = xsd_type
-        self.assertListEqual(list(token.select_results(context)), ['30'])
+            context.item.xsd_type = xsd_type
+            self.assertYields(token.select_results(context), ['30'])
 
-        context = XPathContext(elem, item=10)
-        self.assertListEqual(list(token.select_results(context)), [10])
+            context.item = 10
+            self.assertYields(token.select_results(context), [10])
 
-        context = XPathContext(elem, item='10')
-        self.assertListEqual(list(token.select_results(context)), ['10'])
+            context.item = '10'
+            self.assertYields(token.select_results(context), ['10'])
+        finally:
+            self.reset_context()
 
     def test_cast_to_double(self):
-        token = self.parser.parse('.')
+        token = cached_parse(self.parser, '.')
         self.assertEqual(token.cast_to_double(1), 1.0)
+        self.assertIsInstance(token.cast_to_double(1), float)
+        self.assertEqual(token.cast_to_double(2.5), 2.5)
+        self.assertTrue(math.isnan(token.cast_to_double(float('nan'))))
+        self.assertIsInstance(token.cast_to_double(float('nan')), float)
+        self.assertEqual(token.cast_to_double(True), 1.0)
+        self.assertEqual(token.cast_to_double(Decimal('0.5')), 0.5)
 
         with self.assertRaises(ValueError) as ctx:
             token.cast_to_double('nan')
@@ -197,19 +360,19 @@ class XPath1TokenTest(unittest.TestCase):
             self.parser._xsd_version = '1.0'
 
     def test_atomization_function(self):
-        root = ElementTree.Element('root')
-        token = self.parser.parse('/unknown/.')
-        context = XPathContext(root)
-        self.assertListEqual(list(token.atomization(context)), [])
+        token = cached_parse(self.parser, '/unknown/.')
+        try:
+            self.assertYields(token.atomization(self.reset_context()), [])
+        finally:
+            self.reset_context()
 
         if self.parser.version > '1.0':
             token = self.parser.parse('((), 1, 3, "a")')
-            self.assertListEqual(list(token.atomization()), [1, 3, 'a'])
+            self.assertYields(token.atomization(), [1, 3, 'a'])
 
     def test_boolean_value_function(self):
-        token = self.parser.parse('true()')
-        elem = ElementTree.Element('A')
-        context = XPathContext(elem)
+        token = cached_parse(self.parser, 'true()')
+        context = self.context
 
         self.assertTrue(token.boolean_value(context.root))
         self.assertFalse(token.boolean_value([]))
@@ -224,20 +387,21 @@ class XPath1TokenTest(unittest.TestCase):
         self.assertTrue(token.boolean_value(1))
         self.assertTrue(token.boolean_value(1.0))
         self.assertFalse(token.boolean_value(None))
+        self.assertFalse(token.boolean_value(float('nan')))
+        self.assertFalse(token.boolean_value(Decimal('NaN')))
+        self.assertFalse(token.boolean_value(UntypedAtomic('')))
+        self.assertTrue(token.boolean_value(Int(1)))  # a subclass of int
+        self.assertFalse(token.boolean_value([None]))
 
-    @patch.multiple(DummyXsdType(),
-                    is_simple=lambda x: False,
-                    has_simple_content=lambda x: True)
     def test_data_value_function(self):
-        token = self.parser.parse('true()')
+        token = cached_parse(self.parser, 'true()')
 
         if self.parser.version != '1.0':
-            xsd_type = DummyXsdType()
+            xsd_type = DummySimpleContentType()
             context = XPathContext(ElementTree.XML('<age>19</age>'))
             context.root.xsd_type = xsd_type
             self.assertEqual(token.data_value(context.root), 19)
 
-        context = XPathContext(ElementTree.XML('<dummy/>'))
         obj = AttributeNode('age', '19')
         self.assertEqual(token.data_value(obj), UntypedAtomic('19'))
 
@@ -247,12 +411,10 @@ class XPath1TokenTest(unittest.TestCase):
         obj = TextNode('19')
         self.assertEqual(token.data_value(obj), UntypedAtomic('19'))
 
-        obj = ElementTree.XML('<root>a<e1>b</e1>c<e2>d</e2>e</root>')
-        element_node = ElementNode(obj)
+        element_node = ElementNode(self.mixed_elem)
         self.assertEqual(token.data_value(element_node), UntypedAtomic('abcde'))
 
-        obj = ElementTree.parse(io.StringIO('<root>a<e1>b</e1>c<e2>d</e2>e</root>'))
-        document_node = DocumentNode(obj)
+        document_node = DocumentNode(self.mixed_doc)
         self.assertEqual(token.data_value(document_node), UntypedAtomic('abcde'))
 
         obj = ElementTree.Comment("foo bar")
@@ -273,22 +435,20 @@ class XPath1TokenTest(unittest.TestCase):
         self.assertIs(token.data_value(tagged_object), tagged_object)
 
     def test_string_value_function(self):
-        token = self.parser.parse('true()')
+        token = cached_parse(self.parser, 'true()')
 
-        document = ElementTree.parse(io.StringIO(u'<A>123<B1>456</B1><B2>789</B2></A>'))
+        document = self.text_doc
         element = ElementTree.Element('schema')
-        comment = ElementTree.Comment('nothing important')
-        pi = ElementTree.ProcessingInstruction('action', 'nothing to do')
 
         document_node = XPathContext(document).root
 
         context = XPathContext(element)
         element_node = context.root
-        attribute_node = AttributeNode('id', '0212349350')
-        namespace_node = NamespaceNode('xs', 'http://www.w3.org/2001/XMLSchema')
-        comment_node = CommentNode(comment)
-        pi_node = ProcessingInstructionNode(pi)
-        text_node = TextNode('betelgeuse')
+        attribute_node = self.attribute_node
+        namespace_node = self.namespace_node
+        comment_node = self.comment_node
+        pi_node = self.pi_node
+        text_node = self.text_node
 
         self.assertEqual(token.string_value(document_node), '123456789')
         self.assertEqual(token.string_value(element_node), '')
@@ -318,27 +478,26 @@ class XPath1TokenTest(unittest.TestCase):
         tagged_object = Tagged()
         self.assertEqual(token.string_value(tagged_object), "Tagged(tag='root')")
 
-        with patch.multiple(DummyXsdType, is_simple=lambda x: True):
-            xsd_type = DummyXsdType()
-            element.text = '10'
-            typed_elem = ElementNode(elem=element, xsd_type=xsd_type)
-            self.assertEqual(token.string_value(typed_elem), '10')
-            self.assertEqual(token.data_value(typed_elem), 10)
+        xsd_type = DummySimpleType()
+        element.text = '10'
+        typed_elem = ElementNode(elem=element, xsd_type=xsd_type)
+        self.assertEqual(token.string_value(typed_elem), '10')
+        self.assertEqual(token.data_value(typed_elem), 10)
 
     def test_number_value_function(self):
-        token = self.parser.parse('true()')
+        token = cached_parse(self.parser, 'true()')
         self.assertEqual(token.number_value("19"), 19)
         self.assertTrue(math.isnan(token.number_value("not a number")))
 
     def test_compare_operator(self):
-        token1 = self.parser.parse('true()')
-        token2 = self.parser.parse('false()')
+        token1 = cached_parse(self.parser, 'true()')
+        token2 = cached_parse(self.parser, 'false()')
         self.assertEqual(token1, token1)
         self.assertNotEqual(token1, token2)
         self.assertNotEqual(token2, 'false()')
 
     def test_expected_method(self):
-        token = self.parser.parse('.')
+        token = cached_parse(self.parser, '.')
         self.assertIsNone(token.expected('.'))
 
         with self.assertRaises(SyntaxError) as ctx:
@@ -346,7 +505,7 @@ class XPath1TokenTest(unittest.TestCase):
         self.assertIn('XPST0003', str(ctx.exception))
 
     def test_unexpected_method(self):
-        token = self.parser.parse('.')
+        token = cached_parse(self.parser, '.')
         self.assertIsNone(token.unexpected('*'))
 
         with self.assertRaises(SyntaxError) as ctx:
@@ -363,7 +522,7 @@ class XPath1TokenTest(unittest.TestCase):
         self.assertIn('XPST0017', str(ctx.exception))
 
     def test_xpath_error(self):
-        token = self.parser.parse('.')
+        token = cached_parse(self.parser, '.')
 
         with self.assertRaises(ValueError) as ctx:
             raise token.error('xml:XPST0003')
@@ -383,7 +542,7 @@ class XPath1TokenTest(unittest.TestCase):
         self.assertIn("unknown XPath error code", str(ctx.exception))
 
     def test_xpath_error_shortcuts(self):
-        token = self.parser.parse('.')
+        token = cached_parse(self.parser, '.')
 
         with self.assertRaises(ValueError) as ctx:
             raise token.wrong_value()
@@ -418,7 +577,65 @@ class XPath2TokenTest(XPath1TokenTest):
 
     @classmethod
     def setUpClass(cls):
-        cls.parser = XPath2Parser(namespaces={'xs': XSD_NAMESPACE, 'tst': "http://xpath.test/ns"})
+        super().setUpClass()
+        cls.parser = get_parser(XPath2Parser)
+
+        # Schemas shared by the tests on XSD types, compiled at first use.
+        # The meta-schema is built lazily by the first compilation.
+        if xmlschema is not None:
+            cls.simple_schema = get_schema("""
+                <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+                  <xs:element name="a1" type="xs:int"/>
+                  <xs:element name="a2" type="xs:string"/>
+                  <xs:element name="a3" type="xs:boolean"/>
+                </xs:schema>""")
+            cls.nested_schema = get_schema("""
+                <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+                  <xs:element name="a" type="aType"/>
+                  <xs:complexType name="aType">
+                    <xs:sequence>
+                      <xs:element name="b1" type="b1Type"/>
+                      <xs:element name="b2" type="b2Type"/>
+                      <xs:element name="b3" type="b3Type"/>
+                    </xs:sequence>
+                  </xs:complexType>
+                  <xs:complexType name="b1Type">
+                    <xs:sequence>
+                      <xs:element name="c1" type="xs:int"/>
+                      <xs:element name="c2" type="xs:string"/>
+                    </xs:sequence>
+                  </xs:complexType>
+                  <xs:complexType name="b2Type">
+                    <xs:sequence>
+                      <xs:element name="c1" type="xs:string"/>
+                      <xs:element name="c2" type="xs:string"/>
+                    </xs:sequence>
+                  </xs:complexType>
+                  <xs:complexType name="b3Type">
+                    <xs:sequence>
+                      <xs:element name="c1" type="xs:boolean"/>
+                      <xs:element name="c2" type="xs:string"/>
+                    </xs:sequence>
+                  </xs:complexType>
+                </xs:schema>""")
+            cls.root_schema = get_schema("""
+                <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+                  <xs:element name="root" type="xs:int"/>
+                  <xs:attribute name="a" type="xs:string"/>
+                </xs:schema>""")
+
+    def tearDown(self):
+        self.parser.schema = None  # the parser is shared, don't leak a schema binding
+
+    @contextmanager
+    def bound_schema(self, schema, base_element=None):
+        """Binds the parser to a schema, restoring the previous binding at exit."""
+        schema_proxy = self.parser.schema
+        self.parser.schema = get_schema_proxy(schema, base_element)
+        try:
+            yield
+        finally:
+            self.parser.schema = schema_proxy
 
     def test_bind_namespace_method(self):
         token = self.parser.parse('true()')
@@ -447,21 +664,14 @@ class XPath2TokenTest(XPath1TokenTest):
 
     @unittest.skipIf(xmlschema is None, "xmlschema library required.")
     def test_add_xsd_type(self):
-        schema = xmlschema.XMLSchema("""
-            <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
-              <xs:element name="a1" type="xs:int"/>
-              <xs:element name="a2" type="xs:string"/>
-              <xs:element name="a3" type="xs:boolean"/>
-            </xs:schema>""")
+        schema = self.simple_schema
 
         root_token = self.parser.parse('a1')
         self.assertIsNone(root_token.xsd_types)
         root_token.add_xsd_type(schema.elements['a1'])
         self.assertEqual(root_token.xsd_types, {'a1': schema.meta_schema.types['int']})
 
-        self.parser.schema = xmlschema.xpath.XMLSchemaProxy(schema)
-
-        try:
+        with self.bound_schema(schema):
             root_token = self.parser.parse('a1')
             self.assertEqual(root_token.xsd_types, {'a1': schema.meta_schema.types['int']})
             root_token = self.parser.parse('a2')
@@ -484,45 +694,12 @@ class XPath2TokenTest(XPath1TokenTest):
                 'a3': schema.meta_schema.types['boolean'],
             })
 
-            self.parser.schema = xmlschema.xpath.XMLSchemaProxy(schema, schema.elements['a2'])
-            root_token = self.parser.parse('.')
-            self.assertEqual(root_token.xsd_types, {'a2': schema.meta_schema.types['string']})
-
-        finally:
-            self.parser.schema = None
-
-        schema = xmlschema.XMLSchema("""
-            <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
-              <xs:element name="a" type="aType"/>
-              <xs:complexType name="aType">
-                <xs:sequence>
-                  <xs:element name="b1" type="b1Type"/>
-                  <xs:element name="b2" type="b2Type"/>
-                  <xs:element name="b3" type="b3Type"/>
-                </xs:sequence>
-              </xs:complexType>
-              <xs:complexType name="b1Type">
-                <xs:sequence>
-                  <xs:element name="c1" type="xs:int"/>
-                  <xs:element name="c2" type="xs:string"/>
-                </xs:sequence>
-              </xs:complexType>
-              <xs:complexType name="b2Type">
-                <xs:sequence>
-                  <xs:element name="c1" type="xs:string"/>
-                  <xs:element name="c2" type="xs:string"/>
-                </xs:sequence>
-              </xs:complexType>
-              <xs:complexType name="b3Type">
-                <xs:sequence>
-                  <xs:element name="c1" type="xs:boolean"/>
-                  <xs:element name="c2" type="xs:string"/>
-                </xs:sequence>
-              </xs:complexType>
-            </xs:schema>""")
-        self.parser.schema = xmlschema.xpath.XMLSchemaProxy(schema, schema.elements['a'])
+            with self.bound_schema(schema, schema.elements['a2']):
+                root_token = self.parser.parse('.')
+                self.assertEqual(root_token.xsd_types, {'a2': schema.meta_schema.types['string']})
 
-        try:
+        schema = self.nested_schema
+        with self.bound_schema(schema, schema.elements['a']):
             root_token = self.parser.parse('.')
             self.assertEqual(root_token.xsd_types, {'a': schema.types['aType']})
             root_token = self.parser.parse('*')
@@ -563,16 +740,9 @@ class XPath2TokenTest(XPath1TokenTest):
                 'c2': schema.meta_schema.types['string']
             })
 
-        finally:
-            self.parser.schema = None
-
     @unittest.skipIf(xmlschema is None, "xmlschema library required.")
     def test_add_xsd_type_alternatives(self):
-        schema = xmlschema.XMLSchema("""
-            <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
-              <xs:element name="root" type="xs:int"/>
-              <xs:attribute name="a" type="xs:string"/>
-            </xs:schema>""")
+        schema = self.root_schema
         schema_context = XPathSchemaContext(schema)
 
         root_token = self.parser.parse('root')
@@ -598,39 +768,25 @@ class XPath2TokenTest(XPath1TokenTest):
 
     @unittest.skipIf(xmlschema is None, "xmlschema library required.")
     def test_select_xsd_nodes(self):
-        schema = xmlschema.XMLSchema("""
-            <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
-              <xs:element name="root" type="xs:int"/>
-              <xs:attribute name="a" type="xs:string"/>
-            </xs:schema>""")
-        self.parser.schema = xmlschema.xpath.XMLSchemaProxy(schema)
-
-        try:
+        schema = self.root_schema
+        with self.bound_schema(schema):
             root_token = self.parser.parse('.')
             self.assertEqual(root_token.xsd_types, {
                 'root': schema.elements['root'].type,
             })
 
             context = XPathSchemaContext(root=schema, axis='self')
-            self.assertListEqual(list(root_token.select_xsd_nodes(context, 'root')), [])
+            self.assertYields(root_token.select_xsd_nodes(context, 'root'), [])
 
             tag = '{%s}schema' % XSD_NAMESPACE
             self.assertListEqual(
                 list(e.elem for e in root_token.select_xsd_nodes(context, tag)), [schema]
             )
-        finally:
-            self.parser.schema = None
 
     @unittest.skipIf(xmlschema is None, "xmlschema library required.")
     def test_match_xsd_type(self):
-        schema = xmlschema.XMLSchema("""
-            <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
-              <xs:element name="root" type="xs:int"/>
-              <xs:attribute name="a" type="xs:string"/>
-            </xs:schema>""")
-        self.parser.schema = xmlschema.xpath.XMLSchemaProxy(schema)
-
-        try:
+        schema = self.root_schema
+        with self.bound_schema(schema):
             root_token = self.parser.parse('root')
             self.assertEqual(root_token.xsd_types, {'root': schema.meta_schema.types['int']})
 
@@ -648,18 +804,18 @@ class XPath2TokenTest(XPath1TokenTest):
             obj = list(root_token.select_xsd_nodes(context, 'root'))
             self.assertIsInstance(obj[0], ElementNode)
 
-            context = XPathSchemaContext(root=schema.meta_schema)
-            obj = list(root_token.select_xsd_nodes(context, 'root'))
+            meta_context = XPathSchemaContext(root=schema.meta_schema)
+            obj = list(root_token.select_xsd_nodes(meta_context, 'root'))
             self.assertListEqual(obj, [])
 
             root_token = self.parser.parse('@a')
             self.assertEqual(root_token[0].xsd_types, {'a': schema.meta_schema.types['string']})
 
-            context = XPathSchemaContext(root=schema.meta_schema, axis='self')
+            meta_context.axis = 'self'  # the meta-schema context is reused
             xsd_attribute = schema.attributes['a']
-            context.item = AttributeNode('a', xsd_attribute, xsd_type=xsd_attribute.type)
+            meta_context.item = AttributeNode('a', xsd_attribute, xsd_type=xsd_attribute.type)
 
-            obj = list(root_token.select_xsd_nodes(context, 'a'))
+            obj = list(root_token.select_xsd_nodes(meta_context, 'a'))
             self.assertIsInstance(obj[0], AttributeNode)
             self.assertIsNotNone(obj[0].xsd_type)
             self.assertEqual(root_token[0].xsd_types, {'a': schema.meta_schema.types['string']})
@@ -669,76 +825,63 @@ class XPath2TokenTest(XPath1TokenTest):
             list(root_token.select_xsd_nodes(context, 'a'))
             self.assertIsNone(root_token.xsd_types)
 
-            context = XPathSchemaContext(root=schema.meta_schema, axis='self')
-            attribute = context.item = AttributeNode('a', schema.attributes['a'])
+            meta_context.axis = 'self'
+            attribute = meta_context.item = AttributeNode('a', schema.attributes['a'])
 
-            obj = list(root_token.select_xsd_nodes(context, 'a'))
-            self.assertIsInstance(obj[0], AttributeNode)
-            self.assertEqual(obj[0], attribute)
+            obj = list(root_token.select_xsd_nodes(meta_context, 'a'))
+            self.assertIs(obj[0], attribute)
             self.assertIsInstance(obj[0].value, xmlschema.XsdAttribute)
             self.assertIsInstance(obj[0].typed_value, str)
             self.assertEqual(root_token[0].xsd_types, {'a': schema.meta_schema.types['string']})
 
-        finally:
-            self.parser.schema = None
-
     @unittest.skipIf(xmlschema is None, "xmlschema library required.")
     def test_get_xsd_type(self):
-        schema = xmlschema.XMLSchema("""
-            <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
-              <xs:element name="root" type="xs:int"/>
-              <xs:attribute name="a" type="xs:string"/>
-            </xs:schema>""")
+        schema = self.root_schema
+        builtin_types = schema.meta_schema.types
 
         root_token = self.parser.parse('root')
         self.assertIsNone(root_token.xsd_types)
         self.assertIsNone(root_token.get_xsd_type('root'))
 
-        self.parser.schema = xmlschema.xpath.XMLSchemaProxy(schema)
-
-        try:
+        with self.bound_schema(schema):
             root_token = self.parser.parse('root')
-            self.assertEqual(root_token.xsd_types, {'root': schema.meta_schema.types['int']})
+            self.assertEqual(root_token.xsd_types, {'root': builtin_types['int']})
 
             xsd_type = root_token.get_xsd_type('root')
-            self.assertEqual(xsd_type, schema.meta_schema.types['int'])
+            self.assertIs(xsd_type, builtin_types['int'])
             self.assertIsNone(root_token.get_xsd_type('node'))
 
-            TestElement = namedtuple('XsdElement', 'name xsd_version type')
             root_token.add_xsd_type(
-                TestElement('node', '1.0', schema.meta_schema.types['float'])
+                XsdElementStub('node', '1.0', builtin_types['float'])
             )
             root_token.add_xsd_type(
-                TestElement('node', '1.0', schema.meta_schema.types['boolean'])
+                XsdElementStub('node', '1.0', builtin_types['boolean'])
             )
             root_token.add_xsd_type(
-                TestElement('node', '1.0', schema.meta_schema.types['decimal'])
+                XsdElementStub('node', '1.0', builtin_types['decimal'])
             )
 
-            xsd_type = root_token.get_xsd_type('node')
-            self.assertEqual(xsd_type, schema.meta_schema.types['float'])
-
-            xsd_type = root_token.get_xsd_type(AttributeNode('node', 'false'))
-            self.assertEqual(xsd_type, schema.meta_schema.types['boolean'])
-            xsd_type = root_token.get_xsd_type(AttributeNode('node', 'alpha'))
-            self.assertEqual(xsd_type, schema.meta_schema.types['float'])
+            # With more types the first type that validates the value is selected
+            for item, type_name in [('node', 'float'),
+                                    (AttributeNode('node', 'false'), 'boolean'),
+                                    (AttributeNode('node', 'alpha'), 'float')]:
+                with self.subTest(item=item):
+                    self.assertIs(root_token.get_xsd_type(item), builtin_types[type_name])
 
             elem = ElementTree.Element('node')
             elem.text = 'false'
-            xsd_type = root_token.get_xsd_type(ElementNode(elem))
-            self.assertEqual(xsd_type, schema.meta_schema.types['boolean'])
+            node = ElementNode(elem)
+            xsd_type = root_token.get_xsd_type(node)
+            self.assertIs(xsd_type, builtin_types['boolean'])
 
             typed_element = ElementNode(elem, xsd_type=xsd_type)
             self.assertIs(xsd_type, root_token.get_xsd_type(typed_element))
 
             elem.text = 'alpha'
-            xsd_type = root_token.get_xsd_type(ElementNode(elem))
-            self.assertEqual(xsd_type, schema.meta_schema.types['float'])
-
-        finally:
-            self.parser.schema = None
+            xsd_type = root_token.get_xsd_type(node)
+            self.assertIs(xsd_type, builtin_types['float'])
 
-        schema = xmlschema.XMLSchema("""
+        schema = get_schema("""
             <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
               <xs:element name="a" type="aType"/>
               <xs:complexType name="aType">
@@ -748,70 +891,49 @@ class XPath2TokenTest(XPath1TokenTest):
                 </xs:sequence>
               </xs:complexType>
             </xs:schema>""")
-        self.parser.schema = xmlschema.xpath.XMLSchemaProxy(schema)
-
-        try:
+        with self.bound_schema(schema):
             root_token = self.parser.parse('a')
-            elem = ElementTree.Element('a')
-            elem.append(ElementTree.Element('b1'))
-            elem.append(ElementTree.Element('b2'))
-            elem[0].text = 14
-            elem[1].text = 'true'
-
-            self.assertEqual(
-                root_token.get_xsd_type(ElementNode(elem)), schema.types['aType']
-            )
+            elem = ElementTree.XML('<a><b1>14</b1><b2>true</b2></a>')
+            node = ElementNode(elem)  # untyped, get_xsd_type() reads the element
+            self.assertIs(root_token.get_xsd_type(node), schema.types['aType'])
 
-            TestElement = namedtuple('XsdElement', 'name xsd_version type')
-            root_token.add_xsd_type(TestElement('a', '1.0', schema.meta_schema.types['float']))
-            self.assertEqual(
-                root_token.get_xsd_type(ElementNode(elem)), schema.types['aType']
-            )
+            root_token.add_xsd_type(XsdElementStub('a', '1.0', builtin_types['float']))
+            self.assertIs(root_token.get_xsd_type(node), schema.types['aType'])
 
-            root_token.xsd_types['a'].insert(0, schema.meta_schema.types['boolean'])
-            self.assertEqual(
-                root_token.get_xsd_type(ElementNode(elem)), schema.types['aType']
-            )
+            root_token.xsd_types['a'].insert(0, builtin_types['boolean'])
+            self.assertIs(root_token.get_xsd_type(node), schema.types['aType'])
 
             del elem[1]
-            self.assertEqual(root_token.get_xsd_type(ElementNode(elem)),
-                             schema.meta_schema.types['boolean'])
-        finally:
-            self.parser.schema = None
+            self.assertIs(root_token.get_xsd_type(node), builtin_types['boolean'])
 
     def test_string_value_function(self):
         super(XPath2TokenTest, self).test_string_value_function()
 
         if xmlschema is not None:
-            schema = xmlschema.XMLSchema("""
-                <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
-                  <xs:element name="root" type="xs:int"/>
-                </xs:schema>""")
-
-            token = self.parser.parse('.')
-            self.parser.schema = xmlschema.xpath.XMLSchemaProxy(schema)
+            schema = self.root_schema
+            token = cached_parse(self.parser, '.')
             context = XPathContext(schema)
 
-            try:
+            with self.bound_schema(schema):
                 value = token.string_value(context.root[0])  # 'root' element
                 self.assertIsInstance(value, str)
                 self.assertEqual(value, '1')
-            finally:
-                self.parser.schema = None
 
 
 class XPath30TokenTest(XPath2TokenTest):
 
     @classmethod
     def setUpClass(cls):
-        cls.parser = XPath30Parser(namespaces={'xs': XSD_NAMESPACE, 'tst': "http://xpath.test/ns"})
+        super().setUpClass()
+        cls.parser = get_parser(XPath30Parser)
 
 
 class XPath31TokenTest(XPath30TokenTest):
 
     @classmethod
     def setUpClass(cls):
-        cls.parser = XPath31Parser(namespaces={'xs': XSD_NAMESPACE, 'tst': "http://xpath.test/ns"})
+        super().setUpClass()
+        cls.parser = get_parser(XPath31Parser)
 
 
 if __name__ == '__main__':